@@ -53,6 +53,7 @@ class AgentState(TypedDict):
     research_plan: List[str]
     current_step: int
     findings: List[Dict[str, Any]]
+    findings_soa: Dict[str, List[Any]]  # columnar view of findings: step/desc/analysis
     final_answer: str
     iteration_count: int
     # Phase 4 Intelligence Layer additions
@@ -242,6 +243,7 @@ class ResearchAgent:
         state["research_plan"] = research_plan
         state["current_step"] = 0
         state["findings"] = []
+        state["findings_soa"] = {"step": [], "desc": [], "analysis": []}
         
         # Phase 6: RLHF Integration - Capture research plan
         if self.rlhf_enabled and self.feedback_collector:
@@ -429,6 +431,10 @@ class ResearchAgent:
         }
         
         state["findings"].append(finding)
+        findings_soa = state["findings_soa"]
+        findings_soa["step"].append(state["current_step"])
+        findings_soa["desc"].append(current_step)
+        findings_soa["analysis"].append(analysis.content)
         state["current_step"] += 1
         
         return state
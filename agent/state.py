@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Research Agent State Template
+Shared defaults for building the initial AgentState passed to agent.invoke
+"""
+
+from types import MappingProxyType
+from typing import Any, Callable, Dict
+import os
+
+# Default value for every AgentState key. The mapping itself is read-only,
+# but the nested list/dict defaults are not: treat them as literals and never
+# hand them out - states get fresh copies from _compile_state_factory. Values
+# must be literals whose repr() evaluates back to an equal value
+STATE_TEMPLATE = MappingProxyType({
+    "messages": [],
+    "research_question": "",
+    "research_plan": [],
+    "current_step": 0,
+    "findings": [],
+    "findings_soa": {},  # step/desc/analysis columns, created by the planner
+    "final_answer": "",
+    "iteration_count": 0,
+    # Phase 4 Intelligence Layer components
+    "hypotheses": [],
+    "multi_agent_analysis": {},
+    "quality_assessment": {},
+    "intelligence_insights": {},
+    # Phase 6 RLHF components
+    "session_id": "",
+    "rlhf_feedback": {},
+    "reward_scores": {},
+    # Phase 7 Contextual Engineering components
+    "context_orchestration": {},
+    "research_context": {},
+    # Phase 8 Diffusion components
+    "diffusion_enhanced": False,
+    "synthetic_contexts": [],
+    "visual_analysis_results": {},
+    "creative_ideas": {}
+})
+
+def _new_session_id() -> str:
+    """Generate an opaque random session id (32 hex chars)"""
+    # Session ids are only used as opaque keys, so skip building a uuid.UUID
+    return os.urandom(16).hex()
+
+# Keys the core plan/research/answer loop needs. Optional phases (RLHF,
+# context engineering, intelligence layer) create their own keys on demand
+_MIN_STATE_KEYS = (
+    "messages", "research_question", "research_plan", "current_step",
+    "findings", "final_answer", "iteration_count", "session_id"
+)
+
+def _compile_state_factory(template, keys=None) -> Callable[[str, str], Dict[str, Any]]:
+    """Generate a function that returns the template (or a subset of its keys) as a single dict literal"""
+    # Emitting the defaults as literals means every call builds fresh
+    # list/dict containers (the agent mutates e.g. rlhf_feedback in place)
+    # without a per-key copy loop
+    fields = []
+    for key in (template if keys is None else keys):
+        value = template[key]
+        if key in ("research_question", "session_id"):
+            fields.append(f"{key!r}: {key}")
+        else:
+            fields.append(f"{key!r}: {value!r}")
+    
+    source = (
+        "def _make_state(research_question, session_id):\n"
+        f"    return {{{', '.join(fields)}}}\n"
+    )
+    namespace = {}
+    exec(compile(source, "<agent_state_factory>", "exec"), namespace)
+    return namespace["_make_state"]
+
+_make_state = _compile_state_factory(STATE_TEMPLATE)
+_make_min_state = _compile_state_factory(STATE_TEMPLATE, _MIN_STATE_KEYS)
+
+def create_initial_state(research_question: str) -> Dict[str, Any]:
+    """Build a fresh initial state for a research question"""
+    return _make_state(research_question, _new_session_id())
+
+def create_minimal_state(research_question: str) -> Dict[str, Any]:
+    """Build an initial state with only the keys the core research loop needs"""
+    return _make_min_state(research_question, _new_session_id())
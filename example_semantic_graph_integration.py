@@ -9,12 +9,70 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from agent.research_agent import create_agent
-from semantic_graph.ai_research_agent_integration import integrate_research_agent_with_semantic_graph
-import uuid
 import json
+import operator
+import textwrap
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional
 
-def demonstrate_integration():
+import numpy as np
+
+# Faster JSON encoder for the results dump, falls back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from agent.state import create_initial_state
+
+# Cap on concurrent stats queries against the semantic graph
+STATS_CONCURRENCY_LIMIT = 3
+
+# Failures a demo section reports and moves past; anything else is left to
+# the handler in main()
+DEMO_ERRORS = (ImportError, RuntimeError, KeyError, AttributeError, ValueError)
+
+# Frames shown when the demo aborts on an unexpected error
+TRACEBACK_LIMIT = 10
+
+# Integration event counters shown in the benefits summary
+_get_integration_events = operator.itemgetter(
+    'memory_writes', 'tool_usage_logs', 'findings_captured', 'retrieval_calls',
+    'plan_generations', 'preference_logs', 'monitoring_events'
+)
+
+def _summarize_counts(counts: Dict[str, int]) -> Dict[str, Any]:
+    """Summarize a name -> count mapping in one vectorized pass"""
+    names = list(counts)
+    values = np.fromiter(counts.values(), dtype=np.int64, count=len(names))
+    top = int(values.argmax())
+    p50, p90 = np.percentile(values, [50, 90])
+    
+    return {
+        'total': int(values.sum()),
+        'max': int(values[top]),
+        'top_name': names[top],
+        'p50': float(p50),
+        'p90': float(p90)
+    }
+
+def _start_agent_warm_up() -> Future:
+    """Build the research agent on a background thread"""
+    agent_future = Future()
+    
+    def _warm_up():
+        try:
+            from agent.research_agent import create_agent
+            agent_future.set_result(create_agent())
+        except BaseException as e:
+            agent_future.set_exception(e)
+    
+    threading.Thread(target=_warm_up, daemon=True).start()
+    return agent_future
+
+def demonstrate_integration(agent_future: Optional[Future] = None):
     """Demonstrate the semantic graph integration with research agent"""
     
     print("🔗 AI Research Agent - Semantic Graph Integration Demo")
@@ -22,12 +80,15 @@ def demonstrate_integration():
     
     # Step 1: Create research agent
     print("\n1️⃣ Creating AI Research Agent...")
-    research_agent = create_agent()
+    if agent_future is None:
+        agent_future = _start_agent_warm_up()
+    research_agent = agent_future.result()
     print("✅ Research agent created successfully")
     
     # Step 2: Integrate with semantic graph
     print("\n2️⃣ Integrating with Semantic Graph...")
     try:
+        from semantic_graph.ai_research_agent_integration import integrate_research_agent_with_semantic_graph
         integration = integrate_research_agent_with_semantic_graph(research_agent)
         print("✅ Semantic graph integration completed")
         
@@ -37,7 +98,7 @@ def demonstrate_integration():
         print(f"   🧠 Semantic graph nodes: {stats['semantic_graph_stats']['graph_core']['total_nodes']}")
         print(f"   🔗 Semantic graph edges: {stats['semantic_graph_stats']['graph_core']['total_edges']}")
         
-    except Exception as e:
+    except DEMO_ERRORS as e:
         print(f"❌ Integration failed: {e}")
         print("   Continuing with standard research agent...")
         integration = None
@@ -48,30 +109,8 @@ def demonstrate_integration():
     research_question = "What are the latest developments in large language models?"
     print(f"   🔬 Research Question: {research_question}")
     
-    # Initialize enhanced state
-    session_id = str(uuid.uuid4())
-    initial_state = {
-        "messages": [],
-        "research_question": research_question,
-        "research_plan": [],
-        "current_step": 0,
-        "findings": [],
-        "final_answer": "",
-        "iteration_count": 0,
-        "hypotheses": [],
-        "multi_agent_analysis": {},
-        "quality_assessment": {},
-        "intelligence_insights": {},
-        "session_id": session_id,
-        "rlhf_feedback": {},
-        "reward_scores": {},
-        "context_orchestration": {},
-        "research_context": {},
-        "diffusion_enhanced": False,
-        "synthetic_contexts": [],
-        "visual_analysis_results": {},
-        "creative_ideas": {}
-    }
+    # Initialize enhanced state from the shared template
+    initial_state = create_initial_state(research_question)
     
     try:
         # Run research
@@ -82,30 +121,38 @@ def demonstrate_integration():
         
         # Display results
         print(f"\n📋 Research Plan ({len(result['research_plan'])} steps):")
-        for i, step in enumerate(result["research_plan"], 1):
-            print(f"   {i}. {step}")
+        if result["research_plan"]:
+            print("\n".join(f"   {i}. {step}" for i, step in enumerate(result["research_plan"], 1)))
         
         print(f"\n🔍 Research Steps Completed: {len(result['findings'])}")
         
         print(f"\n🎯 Final Answer Preview:")
-        answer_preview = result["final_answer"][:300] + "..." if len(result["final_answer"]) > 300 else result["final_answer"]
+        answer_preview = textwrap.shorten(result["final_answer"], width=300, placeholder="...")
         print(f"   {answer_preview}")
         
         # Show semantic graph integration benefits
         if integration:
             print("\n4️⃣ Semantic Graph Integration Benefits:")
             
-            # Get updated statistics
-            updated_stats = integration.get_integration_statistics()
-            integration_events = updated_stats['integration_stats']
+            # Get updated statistics, including hook calls still in flight.
+            # Statistics and health are independent, and the monitor's stats
+            # history is locked, so fetch them concurrently
+            integration.wait_for_hooks()
+            with ThreadPoolExecutor(max_workers=STATS_CONCURRENCY_LIMIT) as executor:
+                stats_future = executor.submit(integration.get_integration_statistics)
+                health_future = executor.submit(integration.get_integration_health)
+                updated_stats = stats_future.result()
+                health = health_future.result()
+            (memory_writes, tool_usage, findings, retrievals,
+             plans, preferences, monitoring) = _get_integration_events(updated_stats['integration_stats'])
             
-            print(f"   📝 Memory writes captured: {integration_events['memory_writes']}")
-            print(f"   🛠️ Tool usage logged: {integration_events['tool_usage_logs']}")
-            print(f"   🔍 Findings captured: {integration_events['findings_captured']}")
-            print(f"   📊 Retrieval calls enhanced: {integration_events['retrieval_calls']}")
-            print(f"   📋 Plan generations guided: {integration_events['plan_generations']}")
-            print(f"   👤 Preference logs recorded: {integration_events['preference_logs']}")
-            print(f"   📈 Monitoring events tracked: {integration_events['monitoring_events']}")
+            print(f"   📝 Memory writes captured: {memory_writes}")
+            print(f"   🛠️ Tool usage logged: {tool_usage}")
+            print(f"   🔍 Findings captured: {findings}")
+            print(f"   📊 Retrieval calls enhanced: {retrievals}")
+            print(f"   📋 Plan generations guided: {plans}")
+            print(f"   👤 Preference logs recorded: {preferences}")
+            print(f"   📈 Monitoring events tracked: {monitoring}")
             
             # Show graph growth
             final_graph_stats = updated_stats['semantic_graph_stats']['graph_core']
@@ -116,11 +163,17 @@ def demonstrate_integration():
             # Show node type distribution
             if final_graph_stats['node_types']:
                 print(f"   📊 Node types created:")
-                for node_type, count in final_graph_stats['node_types'].items():
-                    print(f"      {node_type}: {count}")
+                print("\n".join(
+                    f"      {node_type}: {count}"
+                    for node_type, count in final_graph_stats['node_types'].items()
+                ))
+                
+                type_summary = _summarize_counts(final_graph_stats['node_types'])
+                print(f"      Total: {type_summary['total']}, most common: "
+                      f"{type_summary['top_name']} ({type_summary['max']}), "
+                      f"p50: {type_summary['p50']:.1f}, p90: {type_summary['p90']:.1f}")
             
-            # Get integration health
-            health = integration.get_integration_health()
+            # Integration health (fetched above)
             print(f"\n   💚 Integration Health: {health['status']}")
             print(f"   📈 Total events processed: {health['total_events_processed']}")
             
@@ -131,7 +184,7 @@ def demonstrate_integration():
         
         return result, integration
         
-    except Exception as e:
+    except DEMO_ERRORS as e:
         print(f"❌ Research execution failed: {str(e)}")
         return None, integration
 
@@ -162,7 +215,7 @@ def demonstrate_graph_features(integration):
             print(f"   {i}. {result['label']} (score: {result['score']:.3f})")
             print(f"      Method: {result['method']}")
             
-    except Exception as e:
+    except DEMO_ERRORS as e:
         print(f"   ❌ Enhanced retrieval demo failed: {e}")
     
     # Demonstrate graph-aware planning
@@ -183,7 +236,7 @@ def demonstrate_graph_features(integration):
             if step.get('tools_suggested'):
                 print(f"     Tools: {', '.join(step['tools_suggested'][:2])}")
                 
-    except Exception as e:
+    except DEMO_ERRORS as e:
         print(f"   ❌ Graph-aware planning demo failed: {e}")
     
     # Demonstrate user preference modeling
@@ -209,7 +262,7 @@ def demonstrate_graph_features(integration):
         else:
             print(f"   Guidance available: No (using defaults)")
             
-    except Exception as e:
+    except DEMO_ERRORS as e:
         print(f"   ❌ User preference demo failed: {e}")
     
     # Show comprehensive statistics
@@ -232,15 +285,24 @@ def demonstrate_graph_features(integration):
         print(f"     Health Score: {monitoring_stats['health_score']:.3f}")
         print(f"     Health Status: {monitoring_stats['health_status']}")
         
-    except Exception as e:
+    except DEMO_ERRORS as e:
         print(f"   ❌ Statistics demo failed: {e}")
 
 def main():
     """Main demonstration function"""
     
+    # Start building the agent right away, and load the semantic graph
+    # modules on this thread in the meantime
+    agent_future = _start_agent_warm_up()
+    try:
+        import semantic_graph.ai_research_agent_integration  # noqa: F401
+    except ImportError:
+        pass  # reported when the integration step runs
+    
+    integration = None
     try:
         # Run the main integration demonstration
-        result, integration = demonstrate_integration()
+        result, integration = demonstrate_integration(agent_future)
         
         if result:
             # Demonstrate specific graph features
@@ -260,10 +322,19 @@ def main():
             if integration:
                 try:
                     final_stats = integration.get_integration_statistics()
-                    with open('integration_demo_results.json', 'w') as f:
-                        json.dump(final_stats, f, indent=2, default=str)
+                    if ORJSON_AVAILABLE:
+                        # orjson emits bytes, hence binary mode
+                        with open('integration_demo_results.json', 'wb') as f:
+                            f.write(orjson.dumps(
+                                final_stats,
+                                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                                default=str
+                            ))
+                    else:
+                        with open('integration_demo_results.json', 'w') as f:
+                            json.dump(final_stats, f, indent=2, default=str)
                     print(f"\n💾 Integration statistics saved to 'integration_demo_results.json'")
-                except Exception as e:
+                except (OSError, TypeError, ValueError) as e:
                     print(f"⚠️ Could not save results: {e}")
         
         else:
@@ -274,7 +345,11 @@ def main():
     except Exception as e:
         print(f"\n❌ Demonstration failed with error: {str(e)}")
         import traceback
-        traceback.print_exc()
+        traceback.print_exception(type(e), e, e.__traceback__, limit=TRACEBACK_LIMIT)
+    finally:
+        if integration:
+            # Finish background hook calls and hand off their events
+            integration.shutdown()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,88 +4,377 @@ AI Research Agent - Main Entry Point
 Enhanced with proper state management and interactive capabilities
 """
 
-from agent.research_agent import create_agent
-from semantic_graph.ai_research_agent_integration import integrate_research_agent_with_semantic_graph
+from agent.state import create_initial_state, create_minimal_state
+import hashlib
 import json
+import operator
+import os
+import pickle
+import sys
+import textwrap
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional
 
-def run_research(question: str, use_semantic_graph: bool = False):
-    """Run a research session with the given question"""
-    print(f"🔬 Starting research on: {question}")
-    if use_semantic_graph:
-        print("🕸️ Using Semantic Graph Enhancement")
-    print("=" * 60)
+# Semantic result cache configuration
+SEMANTIC_CACHE_DIR = os.path.expanduser("~/.cache/airesearch")
+SEMANTIC_CACHE_MODEL = "all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.85
+SEMANTIC_CACHE_MAX_ENTRIES = 256
+SEMANTIC_CACHE_TTL = 7 * 24 * 3600  # seconds; older persisted results are dropped
+
+# Integration event counters shown after each research run
+_get_integration_events = operator.itemgetter(
+    'memory_writes', 'tool_usage_logs', 'findings_captured',
+    'retrieval_calls', 'plan_generations'
+)
+
+# Background drain of semantic graph events while the agent is running
+EVENT_DRAIN_BATCH_SIZE = 64
+EVENT_DRAIN_INTERVAL = 0.5  # seconds
+
+class _SemanticCache:
+    """Caches research results keyed by embedding similarity of the question"""
     
-    # Create the agent
-    agent = create_agent()
+    def __init__(self, model_name: str = SEMANTIC_CACHE_MODEL,
+                 threshold: float = SEMANTIC_CACHE_THRESHOLD,
+                 cache_dir: str = SEMANTIC_CACHE_DIR,
+                 max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+                 ttl: float = SEMANTIC_CACHE_TTL):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # Normalized embeddings live in a preallocated matrix used as a ring:
+        # row i belongs to _results[i], persisted as _files[i]
+        self._matrix = None
+        self._results = []
+        self._files = []
+        self._next_slot = 0  # row replaced by the next store once full
+        self._encoder = None
+        self._disabled = False
+        self._load_lock = threading.Lock()
     
-    # Integrate with semantic graph if requested
-    integration = None
-    if use_semantic_graph:
+    def warm_up(self, notify=print):
+        """Load the encoder and persisted results unless that's already done"""
+        with self._load_lock:
+            if self._encoder is not None or self._disabled:
+                return
+            try:
+                import numpy as np
+                from sentence_transformers import SentenceTransformer
+                encoder = SentenceTransformer(self.model_name)
+                dim = encoder.get_sentence_embedding_dimension() or len(encoder.encode(""))
+            except Exception as e:
+                notify(f"⚠️ Semantic cache disabled: {e}")
+                self._disabled = True
+                return
+            self._matrix = np.zeros((self.max_entries, dim), dtype=np.float32)
+            self._encoder = encoder
+            self._load_persisted(notify)
+    
+    def _load_persisted(self, notify=print):
+        """Load the newest unexpired results pickled by earlier sessions"""
+        try:
+            dir_stat = os.stat(self.cache_dir)
+        except OSError:
+            return
+        # Unpickling runs arbitrary code, so only trust a directory no one else can write to
+        if dir_stat.st_mode & 0o022 or (hasattr(os, "getuid") and dir_stat.st_uid != os.getuid()):
+            notify(f"⚠️ Ignoring cached results in {self.cache_dir}: writable by other users")
+            return
+        
+        expires_before = time.time() - self.ttl
+        fresh = []
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith(".pkl"):
+                continue
+            path = os.path.join(self.cache_dir, filename)
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            if mtime < expires_before:
+                self._remove_file(path)
+            else:
+                fresh.append((mtime, path))
+        
+        # Oldest first, keeping only the newest max_entries
+        fresh.sort()
+        for _, path in fresh[:-self.max_entries]:
+            self._remove_file(path)
+        for _, path in fresh[-self.max_entries:]:
+            try:
+                with open(path, "rb") as f:
+                    entry = pickle.load(f)
+                self._add(entry["embedding"], entry["result"], path)
+            except Exception:
+                continue
+    
+    def _add(self, embedding, result, path: str):
+        """Put an entry in the next free row, evicting the oldest entry when full"""
+        import numpy as np
+        vector = np.asarray(embedding, dtype=self._matrix.dtype).ravel()
+        if vector.shape[0] != self._matrix.shape[1]:
+            raise ValueError(f"embedding has {vector.shape[0]} dimensions, expected {self._matrix.shape[1]}")
+        
+        if len(self._results) < self.max_entries:
+            slot = len(self._results)
+            self._results.append(result)
+            self._files.append(path)
+        else:
+            slot = self._next_slot
+            self._next_slot = (slot + 1) % self.max_entries
+            if self._files[slot] != path:
+                self._remove_file(self._files[slot])
+            self._results[slot] = result
+            self._files[slot] = path
+        self._matrix[slot] = vector
+    
+    @staticmethod
+    def _remove_file(path: str):
+        """Delete a persisted entry, ignoring files that are already gone"""
         try:
-            print("🔗 Integrating with Semantic Graph...")
-            integration = integrate_research_agent_with_semantic_graph(agent)
-            print("✅ Semantic Graph integration completed")
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def lookup(self, question: str):
+        """Return (cached_result or None, question_embedding); errors count as a miss"""
+        self.warm_up()
+        if self._encoder is None:
+            return None, None
+        
+        try:
+            embedding = self._encoder.encode(question, normalize_embeddings=True)
+            if not self._results:
+                return None, embedding
+            scores = self._matrix[:len(self._results)] @ embedding
         except Exception as e:
-            print(f"⚠️ Semantic Graph integration failed: {e}")
-            print("   Continuing with standard research agent...")
-    
-    # Initialize state - Phase 6 Enhanced with RLHF
-    import uuid
-    session_id = str(uuid.uuid4())
-    
-    initial_state = {
-        "messages": [],
-        "research_question": question,
-        "research_plan": [],
-        "current_step": 0,
-        "findings": [],
-        "final_answer": "",
-        "iteration_count": 0,
-        # Phase 4 Intelligence Layer components
-        "hypotheses": [],
-        "multi_agent_analysis": {},
-        "quality_assessment": {},
-        "intelligence_insights": {},
-        # Phase 6 RLHF components
-        "session_id": session_id,
-        "rlhf_feedback": {},
-        "reward_scores": {}
-    }
+            print(f"⚠️ Semantic cache lookup failed: {e}")
+            return None, None
+        
+        best = int(scores.argmax())
+        if scores[best] >= self.threshold:
+            return self._results[best], embedding
+        return None, embedding
     
+    def store(self, question: str, embedding, result):
+        """Add a result to the cache and persist it to disk"""
+        if embedding is None or self._matrix is None:
+            return
+        
+        key = hashlib.sha1(question.encode("utf-8")).hexdigest()
+        path = os.path.join(self.cache_dir, f"{key}.pkl")
+        try:
+            self._add(embedding, result, path)
+        except ValueError as e:
+            print(f"⚠️ Could not cache result: {e}")
+            return
+        
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            with open(path, "wb") as f:
+                pickle.dump({"question": question, "embedding": embedding, "result": result}, f)
+        except Exception as e:
+            print(f"⚠️ Could not persist cached result: {e}")
+
+_SEMANTIC_CACHE = _SemanticCache()
+
+# Research agent (and optional graph integration) shared across questions.
+# Built once, either by the background warm-up or on first use.
+_AGENT_FUTURE: Optional[Future] = None
+_INTEGRATION_FUTURE: Optional[Future] = None
+_WARMUP_LOCK = threading.Lock()
+# Messages from the background warm-up, held back so they don't interleave
+# with the input prompt and shown once the first question is asked
+_WARMUP_NOTICES: List[str] = []
+
+def _warm_up(agent_future: Future, integration_future: Optional[Future]):
+    """Build the agent, then the graph integration if requested"""
+    global _AGENT_FUTURE, _INTEGRATION_FUTURE
     try:
-        # Run the research
-        result = agent.invoke(initial_state)
+        # Deferred so that CLI commands like 'help' don't pay the agent import cost
+        from agent.research_agent import create_agent
+        agent = create_agent()
+    except BaseException as e:
+        # Forget the failed build so the next question tries again
+        with _WARMUP_LOCK:
+            if _AGENT_FUTURE is agent_future:
+                _AGENT_FUTURE = None
+                _INTEGRATION_FUTURE = None
+        agent_future.set_exception(e)
+        if integration_future is not None:
+            integration_future.set_result(None)
+        return
+    
+    agent_future.set_result(agent)
+    if integration_future is not None:
+        integration_future.set_result(_integrate_semantic_graph(agent, notify=_WARMUP_NOTICES.append))
+    
+    # Load the result cache's encoder too, rather than on the first question
+    _SEMANTIC_CACHE.warm_up(notify=_WARMUP_NOTICES.append)
+
+def _show_warm_up_notices():
+    """Print messages held back by the background warm-up"""
+    while _WARMUP_NOTICES:
+        print(_WARMUP_NOTICES.pop(0))
+
+def _start_warm_up(use_semantic_graph: bool = False, background: bool = True) -> Future:
+    """Start building the shared agent if it isn't already being built"""
+    global _AGENT_FUTURE, _INTEGRATION_FUTURE
+    with _WARMUP_LOCK:
+        if _AGENT_FUTURE is not None:
+            return _AGENT_FUTURE
         
-        # Display results
-        print("\n📋 Research Plan:")
-        for i, step in enumerate(result["research_plan"], 1):
-            print(f"  {i}. {step}")
+        _AGENT_FUTURE = Future()
+        _INTEGRATION_FUTURE = Future() if use_semantic_graph else None
+        args = (_AGENT_FUTURE, _INTEGRATION_FUTURE)
+    
+    if background:
+        threading.Thread(target=_warm_up, args=args, daemon=True).start()
+    else:
+        _warm_up(*args)
+    return _AGENT_FUTURE
+
+def _get_agent():
+    """Return the shared research agent, waiting for the warm-up if it is running"""
+    try:
+        return _start_warm_up(background=False).result()
+    finally:
+        _show_warm_up_notices()
+
+def _get_integration(agent):
+    """Return the semantic graph integration, reusing a warmed-up one if available"""
+    integration_future = _INTEGRATION_FUTURE
+    if integration_future is not None:
+        integration = integration_future.result()
+        _show_warm_up_notices()
+        if integration is not None:
+            return integration
+    return _integrate_semantic_graph(agent)
+
+def _integrate_semantic_graph(agent, notify=print):
+    """Connect the agent to the semantic graph, returning None on failure"""
+    try:
+        notify("🔗 Integrating with Semantic Graph...")
+        from semantic_graph.ai_research_agent_integration import integrate_research_agent_with_semantic_graph
+        integration = integrate_research_agent_with_semantic_graph(agent)
+        notify("✅ Semantic Graph integration completed")
+        return integration
+    except Exception as e:
+        notify(f"⚠️ Semantic Graph integration failed: {e}")
+        notify("   Continuing with standard research agent...")
+        return None
+
+def _drain_events(integration, stop_event: threading.Event):
+    """Process pending graph events in small batches until stopped"""
+    while not stop_event.wait(EVENT_DRAIN_INTERVAL):
+        try:
+            integration.process_pending_events(chunk_size=EVENT_DRAIN_BATCH_SIZE, max_chunks=1)
+        except Exception as e:
+            print(f"⚠️ Background graph event processing failed: {e}")
+
+def _run_agent(agent, initial_state):
+    """Run the agent, streaming node progress to stdout when supported"""
+    if not hasattr(agent, "stream"):
+        return agent.invoke(initial_state)
+    
+    # Each LangGraph node returns the updated state; merge as they arrive so
+    # the user sees progress instead of waiting for the whole run
+    result = dict(initial_state)
+    for update in agent.stream(initial_state):
+        for node_name, node_state in update.items():
+            if node_state:
+                result.update(node_state)
+            sys.stdout.write(f"   ⏳ {node_name} completed\n")
+            sys.stdout.flush()
+    return result
+
+def _invoke_vanilla(agent, question: str):
+    """Run the agent on a minimal state without the semantic graph"""
+    return _run_agent(agent, create_minimal_state(question))
+
+def _invoke_with_graph(agent, integration, question: str):
+    """Run the agent on the full state while draining graph events on a helper thread"""
+    initial_state = create_initial_state(question)
+    stop_event = threading.Event()
+    drain_thread = threading.Thread(
+        target=_drain_events, args=(integration, stop_event), daemon=True
+    )
+    drain_thread.start()
+    try:
+        return _run_agent(agent, initial_state)
+    finally:
+        stop_event.set()
+        drain_thread.join(timeout=0.5)
+
+def run_research(question: str, agent, integration=None):
+    """Run a research session with the given question on a prebuilt agent"""
+    print(f"🔬 Starting research on: {question}")
+    if integration:
+        print("🕸️ Using Semantic Graph Enhancement")
+    print("=" * 60)
+    
+    try:
+        # Reuse the result of a semantically similar question if available
+        result, question_embedding = _SEMANTIC_CACHE.lookup(question)
+        if result is not None:
+            print("⚡ Reusing cached result for a similar research question")
+        else:
+            # Run the research, processing graph events as they accumulate
+            if integration:
+                result = _invoke_with_graph(agent, integration, question)
+            else:
+                result = _invoke_vanilla(agent, question)
+            _SEMANTIC_CACHE.store(question, question_embedding, result)
+        
+        # Display results - collected first and written in one call
+        lines = ["\n📋 Research Plan:\n"]
+        lines.extend(f"  {i}. {step}\n" for i, step in enumerate(result["research_plan"], 1))
         
-        print(f"\n🔍 Research Steps Completed: {len(result['findings'])}")
+        lines.append(f"\n🔍 Research Steps Completed: {len(result['findings'])}\n")
         
-        print("\n📊 Key Findings:")
-        for finding in result["findings"]:
-            print(f"\n  Step {finding['step'] + 1}: {finding['step_description']}")
-            print(f"  Analysis: {finding['analysis'][:200]}...")
+        lines.append("\n📊 Key Findings:\n")
+        findings_soa = result.get("findings_soa")
+        if findings_soa:
+            findings_rows = zip(findings_soa["step"], findings_soa["desc"], findings_soa["analysis"])
+        else:
+            # Results cached before the columnar view existed
+            findings_rows = ((f['step'], f['step_description'], f['analysis']) for f in result["findings"])
+        lines.extend(
+            f"\n  Step {step + 1}: {description}\n  Analysis: {textwrap.shorten(analysis, width=200, placeholder='...')}\n"
+            for step, description, analysis in findings_rows
+        )
         
-        print("\n🎯 Final Answer:")
-        print("-" * 40)
-        print(result["final_answer"])
-        print("-" * 40)
+        lines.append("\n🎯 Final Answer:\n")
+        lines.append("-" * 40 + "\n")
+        lines.append(f"{result['final_answer']}\n")
+        lines.append("-" * 40 + "\n")
         
         # Show semantic graph integration benefits if used
         if integration:
-            print("\n🕸️ Semantic Graph Integration Benefits:")
+            # Count hook calls still running on the integration's pool too
+            integration.wait_for_hooks()
             stats = integration.get_integration_statistics()
-            integration_events = stats['integration_stats']
+            memory_writes, tool_usage, findings, retrievals, plans = _get_integration_events(
+                stats['integration_stats']
+            )
             
-            print(f"   📝 Memory writes captured: {integration_events['memory_writes']}")
-            print(f"   🛠️ Tool usage logged: {integration_events['tool_usage_logs']}")
-            print(f"   🔍 Findings captured: {integration_events['findings_captured']}")
-            print(f"   📊 Enhanced retrievals: {integration_events['retrieval_calls']}")
-            print(f"   📋 Graph-guided plans: {integration_events['plan_generations']}")
-            
-            # Process pending graph events
+            lines.append("\n🕸️ Semantic Graph Integration Benefits:\n")
+            lines.append(f"   📝 Memory writes captured: {memory_writes}\n")
+            lines.append(f"   🛠️ Tool usage logged: {tool_usage}\n")
+            lines.append(f"   🔍 Findings captured: {findings}\n")
+            lines.append(f"   📊 Enhanced retrievals: {retrievals}\n")
+            lines.append(f"   📋 Graph-guided plans: {plans}\n")
+        
+        sys.stdout.writelines(lines)
+        sys.stdout.flush()
+        
+        if integration:
+            # Flush any graph events left over from the background drain
             integration.process_pending_events()
         
         return result
@@ -94,14 +383,19 @@ def run_research(question: str, use_semantic_graph: bool = False):
         print(f"❌ Error during research: {str(e)}")
         return None
 
-def interactive_mode():
+def interactive_mode(use_semantic_graph: bool = False):
     """Run the agent in interactive mode"""
+    # Build the agent while the user is typing their first question
+    _start_warm_up(use_semantic_graph)
+    
     print("🤖 AI Research Agent - Interactive Mode")
     print("Type 'quit' to exit, 'help' for commands")
     print("Type 'graph' to enable semantic graph enhancement")
     print("=" * 50)
     
-    use_semantic_graph = False
+    # Built once on the first question and reused for the rest of the session
+    agent = None
+    integration = None
     
     while True:
         try:
@@ -126,8 +420,13 @@ def interactive_mode():
                 print("Please enter a valid research question.")
                 continue
             
+            if agent is None:
+                agent = _get_agent()
+            if use_semantic_graph and integration is None:
+                integration = _get_integration(agent)
+            
             # Run research
-            result = run_research(question, use_semantic_graph)
+            result = run_research(question, agent, integration if use_semantic_graph else None)
             
             if result:
                 # Ask if user wants to continue
@@ -141,6 +440,10 @@ def interactive_mode():
             break
         except Exception as e:
             print(f"❌ Unexpected error: {str(e)}")
+    
+    if integration is not None:
+        # Finish background hook calls and hand off their events
+        integration.shutdown()
 
 if __name__ == "__main__":
     # You can run in different modes
@@ -153,7 +456,17 @@ if __name__ == "__main__":
             sys.argv.remove('--graph')
         
         question = " ".join(sys.argv[1:])
-        run_research(question, use_graph)
+        if question:
+            agent = _get_agent()
+            integration = _integrate_semantic_graph(agent) if use_graph else None
+            try:
+                run_research(question, agent, integration)
+            finally:
+                if integration is not None:
+                    integration.shutdown()
+        else:
+            # Only '--graph' was given: interactive mode with graph enabled
+            interactive_mode(use_semantic_graph=True)
     else:
         # Interactive mode
         interactive_mode()
\ No newline at end of file
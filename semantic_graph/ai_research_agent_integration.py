@@ -4,31 +4,269 @@ AI Research Agent - Semantic Graph Integration Points
 Implements the integration mapping between research agent components and semantic graph
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from functools import lru_cache
+import array
+import contextvars
+import copy
+import hashlib
 import logging
+import operator
+import os
+import sys
+import threading
+import time
 from datetime import datetime
 
-from .research_agent_integration import SemanticGraphAgent
-from .graph_ingestion import IngestionSource
+import numpy as np
+
+from .research_agent_integration import SemanticGraphAgent, create_semantic_graph_agent
+from .graph_ingestion import IngestionSource, EventBatch, MemoryBatch, ToolUsageBatch, FindingBatch
 from .graph_core import NodeType, EdgeType
 
 logger = logging.getLogger(__name__)
 
+# Ingestion sources bound once for the hooks
+_SRC_MEMORY = IngestionSource.MEMORY
+_SRC_TOOL = IngestionSource.TOOL_USAGE
+_SRC_RESEARCH = IngestionSource.RESEARCH_FINDINGS
+_SRC_RETRIEVAL = IngestionSource.RETRIEVAL_LOGS
+_SRC_PLANNER = IngestionSource.PLANNER_OUTPUTS
+
+# Hook events are buffered and handed to the ingestion engine in batches,
+# flushed once SG_BATCH_SIZE events are pending or SG_BATCH_MS after the first
+SG_BATCH_SIZE = int(os.environ.get('SG_BATCH_SIZE', 64))
+SG_BATCH_MS = int(os.environ.get('SG_BATCH_MS', 50))
+# Set SG_SYNC_INGEST=1 to ingest every event immediately (e.g. in tests)
+SG_SYNC_INGEST = os.environ.get('SG_SYNC_INGEST', '0') == '1'
+
+# Context events below SG_MIN_RELEVANCE are not written to the graph
+SG_MIN_RELEVANCE = float(os.environ.get('SG_MIN_RELEVANCE', 0.3))
+MONITORING_RELEVANCE = 0.3
+RLHF_CAPTURE_RELEVANCE = 0.5
+
+# Returned by fire-and-forget hooks (annotated Union[str, object]) when the
+# graph call failed - details are logged with the traceback; check with
+# `result is _ERR`
+_ERR = object()
+
+# Low-cardinality payload fields (memory_type, strategy, feedback_type,
+# usage context, step names) are interned so buffered events share one
+# string object per value
+_INTERN = sys.intern
+
+# Background workers for hooks whose result the caller doesn't need, and the
+# number of hook calls allowed in flight before callers block
+HOOK_DISPATCH_WORKERS = 4
+HOOK_DISPATCH_LIMIT = 256
+
+# Tool inputs/outputs are logged as a bounded preview, not the full text
+TOOL_PREVIEW_LEN = 2048
+# Ingestion events processed per chunk by process_pending_events
+PENDING_CHUNK_SIZE = 256
+
+# Step telemetry kept in memory and written to the graph as one summary
+# context event per interval
+MONITOR_RING_SIZE = 4096
+MONITOR_SUMMARY_INTERVAL = 60  # seconds
+
+# Recent retrieval results reused by the retrieval hook
+RETRIEVAL_CACHE_SIZE = 512
+RETRIEVAL_CACHE_TTL = 900  # seconds
+
+class StatIdx(IntEnum):
+    """Slots of the integration counters array (names match integration_stats keys)"""
+    MEMORY_WRITES = 0
+    TOOL_USAGE_LOGS = 1
+    FINDINGS_CAPTURED = 2
+    RETRIEVAL_CALLS = 3
+    PLAN_GENERATIONS = 4
+    PREFERENCE_LOGS = 5
+    MONITORING_EVENTS = 6
+    # Cache counters, not hook events
+    RETRIEVAL_CACHE_HITS = 7
+    RETRIEVAL_CACHE_MISSES = 8
+    # Event batching counters (flushes of non-empty batches only)
+    BATCH_FLUSHES_BY_SIZE = 9
+    BATCH_FLUSHES_BY_TIME = 10
+    EVENTS_PER_FLUSH_SUM = 11
+    EVENTS_PER_FLUSH_COUNT = 12
+
+class HookId(IntEnum):
+    """Integration hooks, in the order of the integration points"""
+    MEMORY = 0
+    TOOL = 1
+    FINDING = 2
+    RETRIEVAL = 3
+    PLANNING = 4
+    PREFERENCE = 5
+    MONITORING = 6
+
+# integration_hooks names for each hook
+_NAME_TO_ID = {
+    'memory_writes': HookId.MEMORY,
+    'tool_usage_logs': HookId.TOOL,
+    'findings_capture': HookId.FINDING,
+    'retrieval_calls': HookId.RETRIEVAL,
+    'plan_generation': HookId.PLANNING,
+    'preference_logging': HookId.PREFERENCE,
+    'monitoring': HookId.MONITORING
+}
+
+_STAT_NAMES = tuple(idx.name.lower() for idx in StatIdx)
+_EVENT_STAT_COUNT = StatIdx.RETRIEVAL_CACHE_HITS  # slots before this count hook events
+
+# Last formatted wall-clock time, reused for calls within the same millisecond
+_ts_cache = (0, '')
+_ts_lock = threading.Lock()
+
+def _iso_now_cached() -> str:
+    """Current time as an ISO 8601 string, formatted at most once per millisecond"""
+    global _ts_cache
+    now_ns = time.time_ns()
+    last_ns, last_str = _ts_cache
+    if now_ns - last_ns < 1_000_000:
+        return last_str
+    with _ts_lock:
+        _ts_cache = (now_ns, datetime.fromtimestamp(now_ns / 1e9).isoformat())
+        return _ts_cache[1]
+
+def _preview(value: Any, max_len: int = TOOL_PREVIEW_LEN) -> Dict[str, Any]:
+    """Length-capped view of a tool input/output"""
+    text = value if isinstance(value, str) else repr(value)
+    return {'preview': text[:max_len], 'len': len(text)}
+
+# Hook payload readers: plain dict lookups with defaults, kept free of
+# try/except so the hooks only guard the graph calls
+
+def _extract_memory_fields(memory_data: Dict[str, Any]) -> tuple:
+    """(content, importance, memory_type, session_id, concepts, citations)"""
+    return (
+        memory_data.get('content', ''),
+        memory_data.get('importance', 0.5),
+        _INTERN(str(memory_data.get('memory_type', 'general'))),
+        memory_data.get('session_id', 'default'),
+        memory_data.get('concepts'),
+        memory_data.get('citations')
+    )
+
+def _extract_tool_fields(tool_data: Dict[str, Any]) -> tuple:
+    """(tool_name, tool_input, tool_output, execution_time, success, usage_context)"""
+    return (
+        tool_data.get('tool_name', ''),
+        tool_data.get('tool_input', ''),
+        tool_data.get('tool_output', ''),
+        tool_data.get('execution_time', 0.0),
+        tool_data.get('success', True),
+        _INTERN(str(tool_data.get('context', 'research')))
+    )
+
+def _extract_finding_fields(finding_data: Dict[str, Any]) -> tuple:
+    """(finding, analysis, confidence, sources, step_info)"""
+    step_info = finding_data.get('step_info')
+    return (
+        finding_data.get('finding', ''),
+        finding_data.get('analysis', ''),
+        finding_data.get('confidence', 0.5),
+        finding_data.get('sources', []),
+        # Findings are ingested in batches, so a malformed step_info is
+        # replaced here rather than failing the batch it lands in
+        step_info if isinstance(step_info, dict) else {}
+    )
+
+def _extract_retrieval_fields(retrieval_data: Dict[str, Any]) -> tuple:
+    """(query, query_embedding, strategy, top_k, node_types)"""
+    return (
+        retrieval_data.get('query', ''),
+        retrieval_data.get('query_embedding'),
+        _INTERN(str(retrieval_data.get('strategy', 'hybrid'))),
+        retrieval_data.get('top_k', 10),
+        retrieval_data.get('node_types')
+    )
+
+def _extract_planning_fields(planning_data: Dict[str, Any]) -> tuple:
+    """(research_question, context, strategy, max_steps)"""
+    return (
+        planning_data.get('research_question', ''),
+        planning_data.get('context', {}),
+        _INTERN(str(planning_data.get('strategy', 'hybrid'))),
+        planning_data.get('max_steps', 8)
+    )
+
+def _extract_preference_fields(preference_data: Dict[str, Any]) -> tuple:
+    """(user_id, preferred_content, rejected_content, feedback_type, confidence, context)"""
+    return (
+        preference_data.get('user_id', 'anonymous'),
+        preference_data.get('preferred_content', ''),
+        preference_data.get('rejected_content', ''),
+        _INTERN(str(preference_data.get('feedback_type', 'quality'))),
+        preference_data.get('confidence', 1.0),
+        preference_data.get('context', '')
+    )
+
+def _extract_monitoring_fields(monitoring_data: Dict[str, Any]) -> tuple:
+    """(step_name, execution_time, success, error_type)"""
+    return (
+        _INTERN(str(monitoring_data.get('step_name', 'unknown'))),
+        monitoring_data.get('execution_time', 0.0),
+        monitoring_data.get('success', True),
+        monitoring_data.get('error_type', 'general_error')
+    )
+
 class AIResearchAgentIntegration:
     """Main integration class connecting AI Research Agent with Semantic Graph"""
     
+    # No per-instance __dict__: every attribute is set in __init__
+    __slots__ = (
+        'semantic_graph', 'integration_hooks', '_hooks',
+        '_stats', '_stats_lock', '_min_relevance', '_step_handles',
+        '_monitor_ring', '_monitor_timer', '_monitor_lock',
+        '_retrieval_cache', '_query_embeddings', '_retrieval_cache_lock',
+        '_batch_queues', '_batch_priorities', '_batch_pending', '_batch_lock', '_batch_timer',
+        '_dispatch_pool', '_dispatch_sem', '_inflight', '_inflight_cond'
+    )
+    
     def __init__(self, semantic_graph_agent: SemanticGraphAgent):
         self.semantic_graph = semantic_graph_agent
-        self.integration_hooks = {}
-        self.integration_stats = {
-            'memory_writes': 0,
-            'tool_usage_logs': 0,
-            'findings_captured': 0,
-            'retrieval_calls': 0,
-            'plan_generations': 0,
-            'preference_logs': 0,
-            'monitoring_events': 0
-        }
+        # Counters indexed by StatIdx; integration_stats is the dict view
+        self._stats = array.array('Q', [0] * len(StatIdx))
+        self._stats_lock = threading.Lock()  # hooks also run on the dispatch pool
+        
+        self._min_relevance = SG_MIN_RELEVANCE
+        
+        # Monitoring handles for step names seen so far
+        self._step_handles: Dict[str, int] = {}
+        
+        # (step_name, execution_time, success, error_type or None, time_ns)
+        # per monitored step, summarized into the graph periodically
+        self._monitor_ring: deque = deque(maxlen=MONITOR_RING_SIZE)
+        self._monitor_timer: Optional[threading.Timer] = None
+        self._monitor_lock = threading.Lock()
+        
+        # LRU of (expiry, graph cache generation, results) keyed by normalized
+        # retrieval request, and LRU of query embeddings seen so far keyed by
+        # normalized query
+        self._retrieval_cache: OrderedDict = OrderedDict()
+        self._query_embeddings: OrderedDict = OrderedDict()
+        self._retrieval_cache_lock = threading.Lock()
+        
+        # Pending hook events per source (column batches or lists of dicts),
+        # flushed by size or by timer
+        self._batch_queues: Dict[IngestionSource, Union[EventBatch, List[Dict[str, Any]]]] = {}
+        self._batch_priorities: Dict[IngestionSource, int] = {}
+        self._batch_pending = 0
+        self._batch_lock = threading.Lock()
+        self._batch_timer: Optional[threading.Timer] = None
+        
+        # Fire-and-forget hooks run off the caller's critical path
+        self._dispatch_pool = ThreadPoolExecutor(max_workers=HOOK_DISPATCH_WORKERS, thread_name_prefix='sg-hook')
+        self._dispatch_sem = threading.BoundedSemaphore(HOOK_DISPATCH_LIMIT)
+        # Hook calls submitted but not finished yet, waited on before draining
+        self._inflight = 0
+        self._inflight_cond = threading.Condition()
         
         # Register integration hooks
         self._register_integration_hooks()
@@ -37,149 +275,199 @@ class AIResearchAgentIntegration:
     
     def _register_integration_hooks(self):
         """Register all integration hooks based on the mapping table"""
+        # Indexed by HookId, in the order of the integration points below
+        self._hooks = (
+            self._handle_memory_output,
+            self._handle_tool_usage,
+            self._handle_finding,
+            self._handle_retrieval,
+            self._handle_planning,
+            self._handle_preference,
+            self._handle_monitoring
+        )
         
-        # Memory writes integration
-        self.integration_hooks['memory_writes'] = self._handle_memory_output
-        
-        # Tool usage logs integration
-        self.integration_hooks['tool_usage_logs'] = self._handle_tool_usage
+        # Name-keyed view kept for existing callers
+        self.integration_hooks = {name: self._hooks[hook_id] for name, hook_id in _NAME_TO_ID.items()}
+    
+    def dispatch(self, hook: HookId, data: Dict[str, Any]):
+        """Call an integration hook by id on this thread and return its result"""
+        return self._hooks[hook](data)
+    
+    def _submit_background(self, hook, data: Dict[str, Any]):
+        """Run a hook on the pool without waiting for its result, blocking only when too many are in flight"""
+        if SG_SYNC_INGEST:
+            hook(data)
+            return
         
-        # Findings capture integration
-        self.integration_hooks['findings_capture'] = self._handle_finding
+        self._dispatch_sem.acquire()
+        with self._inflight_cond:
+            self._inflight += 1
+        try:
+            # Run in a copy of the caller's context so hooks see e.g. the current episode
+            future = self._dispatch_pool.submit(contextvars.copy_context().run, hook, data)
+        except RuntimeError:
+            # Pool already shut down, run inline instead of dropping the event
+            self._hook_done()
+            hook(data)
+            return
+        future.add_done_callback(self._hook_done)
+    
+    def _hook_done(self, future=None):
+        """Log a failed background hook call, release its slot and wake waiters once none are left"""
+        if future is not None and not future.cancelled():
+            # Nobody waits on these futures, so this is the only place errors
+            # raised outside a hook's own try (e.g. a malformed payload) surface
+            error = future.exception()
+            if error is not None:
+                logger.error("Background hook call failed", exc_info=error)
+        self._dispatch_sem.release()
+        with self._inflight_cond:
+            self._inflight -= 1
+            if not self._inflight:
+                self._inflight_cond.notify_all()
+    
+    def wait_for_hooks(self, timeout: Optional[float] = None) -> bool:
+        """Block until every dispatched hook call has finished, False on timeout"""
+        with self._inflight_cond:
+            return self._inflight_cond.wait_for(lambda: not self._inflight, timeout)
+    
+    def shutdown(self, wait: bool = True):
+        """Finish background hook calls and hand their events to the ingestion engine"""
+        self._dispatch_pool.shutdown(wait=wait)
+        with self._monitor_lock:
+            if self._monitor_timer is not None:
+                self._monitor_timer.cancel()
+                self._monitor_timer = None
+        self.flush_monitoring_summary()
+        self.flush_events('shutdown')
+    
+    def _enqueue_event(self, source: IngestionSource, data: Dict[str, Any], priority: int = 1):
+        """Buffer an ingestion data dict, flushing when the batch is full"""
+        self._enqueue(source, priority, list, data)
+    
+    def _enqueue(self, source: IngestionSource, priority: int, batch_type, *row):
+        """Append one event's fields to the source's batch, flushing when the batch is full"""
+        if SG_SYNC_INGEST:
+            batch = batch_type()
+            batch.append(*row)
+            self.semantic_graph.ingestion_engine.ingest_events_batch(source, batch, priority=priority)
+            return
         
-        # Retrieval calls integration
-        self.integration_hooks['retrieval_calls'] = self._handle_retrieval
+        with self._batch_lock:
+            batch = self._batch_queues.get(source)
+            if batch is None:
+                batch = self._batch_queues[source] = batch_type()
+            batch.append(*row)
+            self._batch_priorities[source] = max(priority, self._batch_priorities.get(source, 0))
+            self._batch_pending += 1
+            full = self._batch_pending >= SG_BATCH_SIZE
+            if not full and self._batch_timer is None:
+                self._batch_timer = threading.Timer(SG_BATCH_MS / 1000.0, self.flush_events, args=('timer',))
+                self._batch_timer.daemon = True
+                self._batch_timer.start()
         
-        # Plan generation integration
-        self.integration_hooks['plan_generation'] = self._handle_planning
+        if full:
+            self.flush_events('size')
+    
+    def flush_events(self, reason: str = 'manual'):
+        """Hand all buffered hook events to the ingestion engine, one batch per source"""
+        with self._batch_lock:
+            queues, priorities = self._batch_queues, self._batch_priorities
+            self._batch_queues, self._batch_priorities = {}, {}
+            self._batch_pending = 0
+            if self._batch_timer is not None:
+                self._batch_timer.cancel()
+                self._batch_timer = None
         
-        # Preference logging integration
-        self.integration_hooks['preference_logging'] = self._handle_preference
+        for source, data_list in queues.items():
+            try:
+                self.semantic_graph.ingestion_engine.ingest_events_batch(
+                    source, data_list, priority=priorities[source]
+                )
+            except Exception:
+                logger.exception("Batch ingestion of %d %s events failed", len(data_list), source.value)
         
-        # Monitoring integration
-        self.integration_hooks['monitoring'] = self._handle_monitoring
+        if queues:
+            flushed = sum(len(d) for d in queues.values())
+            with self._stats_lock:
+                if reason == 'size':
+                    self._stats[StatIdx.BATCH_FLUSHES_BY_SIZE] += 1
+                elif reason == 'timer':
+                    self._stats[StatIdx.BATCH_FLUSHES_BY_TIME] += 1
+                self._stats[StatIdx.EVENTS_PER_FLUSH_SUM] += flushed
+                self._stats[StatIdx.EVENTS_PER_FLUSH_COUNT] += 1
+            logger.info("sg_flush size=%d reason=%s", flushed, reason)
     
     # Integration Point 1: Memory writes -> GraphIngestionEngine.handle_memory_output()
-    def _handle_memory_output(self, memory_data: Dict[str, Any]) -> str:
+    def _handle_memory_output(self, memory_data: Dict[str, Any]) -> Union[str, object]:
         """
         Hook: MemoryManager.write()
         What Happens: New nodes/edges created from extracted entities
         """
+        content, importance, memory_type, session_id, concepts, citations = _extract_memory_fields(memory_data)
+        
         try:
-            # Extract memory content and metadata
-            content = memory_data.get('content', '')
-            importance = memory_data.get('importance', 0.5)
-            memory_type = memory_data.get('memory_type', 'general')
-            session_id = memory_data.get('session_id', 'default')
-            
-            # Prepare ingestion data
-            ingestion_data = {
-                'content': content,
-                'importance': importance,
-                'memory_type': memory_type,
-                'session_id': session_id,
-                'timestamp': datetime.now().isoformat(),
-                'source': 'memory_manager'
-            }
-            
-            # Add concepts and citations if available
-            if 'concepts' in memory_data:
-                ingestion_data['concepts'] = memory_data['concepts']
-            if 'citations' in memory_data:
-                ingestion_data['citations'] = memory_data['citations']
-            
-            # Ingest into semantic graph
-            self.semantic_graph.ingestion_engine.ingest_event(
-                IngestionSource.MEMORY,
-                ingestion_data,
-                priority=2
+            # Ingest into semantic graph (concepts and citations if available)
+            self._enqueue(
+                _SRC_MEMORY, 2, MemoryBatch,
+                content, importance, memory_type, session_id, time.time_ns(), concepts, citations
             )
-            
-            self.integration_stats['memory_writes'] += 1
-            
-            return f"Memory content ingested into semantic graph: {len(content)} chars"
-            
-        except Exception as e:
-            logger.error(f"Memory output integration failed: {e}")
-            return f"Memory integration error: {str(e)}"
+        except Exception:
+            logger.exception("Memory output integration failed")
+            return _ERR
+        
+        with self._stats_lock:
+            self._stats[StatIdx.MEMORY_WRITES] += 1
+        
+        return f"Memory content ingested into semantic graph: {len(content)} chars"
     
     # Integration Point 2: Tool usage logs -> GraphIngestionEngine.handle_tool_usage()
-    def _handle_tool_usage(self, tool_data: Dict[str, Any]) -> str:
+    def _handle_tool_usage(self, tool_data: Dict[str, Any]) -> Union[str, object]:
         """
         Hook: ToolExecutor.execute_tool()
         What Happens: Records "UsesTool" edges and merges duplicates
         """
+        tool_name, tool_input, tool_output, execution_time, success, usage_context = _extract_tool_fields(tool_data)
+        
         try:
-            tool_name = tool_data.get('tool_name', '')
-            tool_input = tool_data.get('tool_input', '')
-            tool_output = tool_data.get('tool_output', '')
-            execution_time = tool_data.get('execution_time', 0.0)
-            success = tool_data.get('success', True)
-            
-            # Prepare tool usage data
-            usage_data = {
-                'tool_name': tool_name,
-                'input': tool_input,
-                'output': tool_output,
-                'execution_time': execution_time,
-                'success': success,
-                'timestamp': datetime.now().isoformat(),
-                'usage_context': tool_data.get('context', 'research')
-            }
-            
-            # Ingest tool usage
-            self.semantic_graph.ingestion_engine.ingest_event(
-                IngestionSource.TOOL_USAGE,
-                usage_data,
-                priority=1
+            # Ingest tool usage, with inputs/outputs cut down to previews here on
+            # the dispatch pool rather than on the tool caller's thread
+            self._enqueue(
+                _SRC_TOOL, 1, ToolUsageBatch,
+                tool_name, _preview(tool_input), _preview(tool_output),
+                execution_time, success, time.time_ns(), usage_context
             )
-            
-            self.integration_stats['tool_usage_logs'] += 1
-            
-            return f"Tool usage logged: {tool_name} -> semantic graph"
-            
-        except Exception as e:
-            logger.error(f"Tool usage integration failed: {e}")
-            return f"Tool usage integration error: {str(e)}"
+        except Exception:
+            logger.exception("Tool usage integration failed")
+            return _ERR
+        
+        with self._stats_lock:
+            self._stats[StatIdx.TOOL_USAGE_LOGS] += 1
+        
+        return f"Tool usage logged: {tool_name} -> semantic graph"
     
     # Integration Point 3: Findings capture -> GraphIngestionEngine.handle_finding()
-    def _handle_finding(self, finding_data: Dict[str, Any]) -> str:
+    def _handle_finding(self, finding_data: Dict[str, Any]) -> Union[str, object]:
         """
         Hook: ResearchLoop.capture_finding()
         What Happens: Ingests summaries/triples into graph
         """
+        finding_content, analysis, confidence, sources, step_info = _extract_finding_fields(finding_data)
+        
         try:
-            finding_content = finding_data.get('finding', '')
-            step_info = finding_data.get('step_info', {})
-            confidence = finding_data.get('confidence', 0.5)
-            sources = finding_data.get('sources', [])
-            analysis = finding_data.get('analysis', '')
-            
-            # Prepare research finding data
-            research_data = {
-                'finding': finding_content,
-                'analysis': analysis,
-                'confidence': confidence,
-                'sources': sources,
-                'step_info': step_info,
-                'research_step': step_info.get('step_number', 0),
-                'timestamp': datetime.now().isoformat()
-            }
-            
             # Ingest research finding
-            self.semantic_graph.ingestion_engine.ingest_event(
-                IngestionSource.RESEARCH_FINDINGS,
-                research_data,
-                priority=2
+            self._enqueue(
+                _SRC_RESEARCH, 2, FindingBatch,
+                finding_content, analysis, confidence, sources, step_info, time.time_ns()
             )
-            
-            self.integration_stats['findings_captured'] += 1
-            
-            return f"Research finding captured: {len(finding_content)} chars"
-            
-        except Exception as e:
-            logger.error(f"Finding capture integration failed: {e}")
-            return f"Finding capture error: {str(e)}"
+        except Exception:
+            logger.exception("Finding capture integration failed")
+            return _ERR
+        
+        with self._stats_lock:
+            self._stats[StatIdx.FINDINGS_CAPTURED] += 1
+        
+        return f"Research finding captured: {len(finding_content)} chars"
     
     # Integration Point 4: Retrieval calls -> GraphAwareRetrieval.retrieve()
     def _handle_retrieval(self, retrieval_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -187,43 +475,110 @@ class AIResearchAgentIntegration:
         Hook: Retriever.get_relevant()
         What Happens: Reranks and expands vector hits via graph paths
         """
+        query, query_embedding, strategy, top_k, node_types = _extract_retrieval_fields(retrieval_data)
+        
         try:
-            query = retrieval_data.get('query', '')
-            query_embedding = retrieval_data.get('query_embedding')
-            strategy = retrieval_data.get('strategy', 'hybrid')
-            top_k = retrieval_data.get('top_k', 10)
-            node_types = retrieval_data.get('node_types')
+            # Text-only requests can be answered from the cache
+            cache_key = None
+            if query_embedding is None:
+                cache_key = self._retrieval_cache_key(query, strategy, top_k, node_types)
+                # Read before retrieving, so a change made meanwhile marks the result stale
+                generation = self.semantic_graph.cache_generation
+                cached = self._get_cached_retrieval(cache_key)
+                if cached is not None:
+                    with self._stats_lock:
+                        self._stats[StatIdx.RETRIEVAL_CACHE_HITS] += 1
+                    return cached
+                with self._stats_lock:
+                    self._stats[StatIdx.RETRIEVAL_CACHE_MISSES] += 1
+                # Reuse the embedding a caller supplied for this query earlier
+                query_embedding = self._get_query_embedding(query)
+            else:
+                self._store_query_embedding(query, query_embedding)
             
             # Perform graph-aware retrieval
-            results = self.semantic_graph.enhanced_retrieval(
-                query=query,
-                query_embedding=query_embedding,
-                strategy=strategy,
-                top_k=top_k,
-                node_types=node_types
-            )
+            if query_embedding is not None:
+                results = self.semantic_graph.enhanced_retrieval_precomputed(
+                    query, query_embedding, strategy, top_k, node_types
+                )
+            else:
+                results = self.semantic_graph.enhanced_retrieval(
+                    query, None, strategy, top_k, node_types
+                )
             
             # Log retrieval event
             retrieval_log = {
                 'query': query,
                 'strategy': strategy,
                 'results_count': len(results.get('results', [])),
-                'timestamp': datetime.now().isoformat()
+                'timestamp_ns': time.time_ns()
             }
             
-            self.semantic_graph.ingestion_engine.ingest_event(
-                IngestionSource.RETRIEVAL_LOGS,
-                retrieval_log,
-                priority=1
-            )
-            
-            self.integration_stats['retrieval_calls'] += 1
-            
-            return results
-            
+            self._enqueue_event(_SRC_RETRIEVAL, retrieval_log, priority=1)
         except Exception as e:
-            logger.error(f"Retrieval integration failed: {e}")
+            logger.exception("Retrieval integration failed")
             return {'error': str(e), 'results': []}
+        
+        with self._stats_lock:
+            self._stats[StatIdx.RETRIEVAL_CALLS] += 1
+        
+        if cache_key is not None and 'error' not in results:
+            self._store_cached_retrieval(cache_key, results, generation)
+        
+        return results
+    
+    @staticmethod
+    def _query_hash(query: str) -> bytes:
+        """Digest of the normalized query text"""
+        return hashlib.blake2b(query.strip().lower().encode(), digest_size=16).digest()
+    
+    @classmethod
+    def _retrieval_cache_key(cls, query: str, strategy: str, top_k: int, node_types: Optional[List[str]]) -> bytes:
+        """Build a compact cache key for a retrieval request"""
+        query_hash = cls._query_hash(query)
+        types_part = '|'.join(sorted(node_types)) if node_types else ''
+        return b'\0'.join((query_hash, strategy.encode(), str(top_k).encode(), types_part.encode()))
+    
+    def _get_cached_retrieval(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a copy of unexpired cached results for key, or None"""
+        with self._retrieval_cache_lock:
+            entry = self._retrieval_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, generation, results = entry
+            # The graph may have changed through another integration sharing it,
+            # or through a hook that writes to it directly (e.g. preferences)
+            if time.monotonic() >= expires_at or generation != self.semantic_graph.cache_generation:
+                del self._retrieval_cache[key]
+                return None
+            self._retrieval_cache.move_to_end(key)
+        return copy.deepcopy(results)
+    
+    def _store_cached_retrieval(self, key: bytes, results: Dict[str, Any], generation: int):
+        """Cache retrieval results computed at the given graph generation, evicting the LRU entry when full"""
+        with self._retrieval_cache_lock:
+            self._retrieval_cache[key] = (time.monotonic() + RETRIEVAL_CACHE_TTL, generation, copy.deepcopy(results))
+            self._retrieval_cache.move_to_end(key)
+            while len(self._retrieval_cache) > RETRIEVAL_CACHE_SIZE:
+                self._retrieval_cache.popitem(last=False)
+    
+    def _get_query_embedding(self, query: str) -> Optional[Any]:
+        """Return the embedding last supplied for query, or None"""
+        key = self._query_hash(query)
+        with self._retrieval_cache_lock:
+            embedding = self._query_embeddings.get(key)
+            if embedding is not None:
+                self._query_embeddings.move_to_end(key)
+        return embedding
+    
+    def _store_query_embedding(self, query: str, embedding: Any):
+        """Remember a caller-supplied query embedding, evicting the least recently used when full"""
+        key = self._query_hash(query)
+        with self._retrieval_cache_lock:
+            self._query_embeddings[key] = embedding
+            self._query_embeddings.move_to_end(key)
+            while len(self._query_embeddings) > RETRIEVAL_CACHE_SIZE:
+                self._query_embeddings.popitem(last=False)
     
     # Integration Point 5: Plan generation -> GraphAwarePlanning.generate_plan()
     def _handle_planning(self, planning_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -231,12 +586,9 @@ class AIResearchAgentIntegration:
         Hook: Planner.create_plan()
         What Happens: Seeds tasks from high-importance graph neighborhoods
         """
+        research_question, context, strategy, max_steps = _extract_planning_fields(planning_data)
+        
         try:
-            research_question = planning_data.get('research_question', '')
-            context = planning_data.get('context', {})
-            strategy = planning_data.get('strategy', 'hybrid')
-            max_steps = planning_data.get('max_steps', 8)
-            
             # Generate graph-aware plan
             plan = self.semantic_graph.enhanced_planning(
                 research_question=research_question,
@@ -251,37 +603,29 @@ class AIResearchAgentIntegration:
                 'strategy': strategy,
                 'plan_steps': len(plan.get('plan_steps', [])),
                 'graph_connectivity': plan.get('graph_connectivity', {}),
-                'timestamp': datetime.now().isoformat()
+                'timestamp_ns': time.time_ns()
             }
             
-            self.semantic_graph.ingestion_engine.ingest_event(
-                IngestionSource.PLANNER_OUTPUTS,
-                planning_log,
-                priority=2
-            )
-            
-            self.integration_stats['plan_generations'] += 1
-            
-            return plan
-            
+            self._enqueue_event(_SRC_PLANNER, planning_log, priority=2)
         except Exception as e:
-            logger.error(f"Planning integration failed: {e}")
+            logger.exception("Planning integration failed")
             return {'error': str(e), 'plan_steps': []}
+        
+        with self._stats_lock:
+            self._stats[StatIdx.PLAN_GENERATIONS] += 1
+        
+        return plan
     
     # Integration Point 6: Preference logging -> GraphRLHFIntegration.record_preference()
-    def _handle_preference(self, preference_data: Dict[str, Any]) -> str:
+    def _handle_preference(self, preference_data: Dict[str, Any]) -> Union[str, object]:
         """
         Hook: RLHFManager.log_preference()
         What Happens: Adds typed "Prefers" edges and detects reward-hacking patterns
         """
+        (user_id, preferred_content, rejected_content,
+         feedback_type, confidence, context) = _extract_preference_fields(preference_data)
+        
         try:
-            user_id = preference_data.get('user_id', 'anonymous')
-            preferred_content = preference_data.get('preferred_content', '')
-            rejected_content = preference_data.get('rejected_content', '')
-            feedback_type = preference_data.get('feedback_type', 'quality')
-            confidence = preference_data.get('confidence', 1.0)
-            context = preference_data.get('context', '')
-            
             # Record preference in semantic graph
             preference_id = self.semantic_graph.record_user_feedback(
                 user_id=user_id,
@@ -291,57 +635,101 @@ class AIResearchAgentIntegration:
                 confidence=confidence,
                 context=context
             )
-            
-            self.integration_stats['preference_logs'] += 1
-            
-            return f"User preference recorded: {preference_id}"
-            
-        except Exception as e:
-            logger.error(f"Preference logging integration failed: {e}")
-            return f"Preference logging error: {str(e)}"
+        except Exception:
+            logger.exception("Preference logging integration failed")
+            return _ERR
+        
+        with self._stats_lock:
+            self._stats[StatIdx.PREFERENCE_LOGS] += 1
+        
+        return f"User preference recorded: {preference_id}"
     
     # Integration Point 7: Monitoring -> GraphMonitor.record_metrics()
-    def _handle_monitoring(self, monitoring_data: Dict[str, Any]) -> str:
+    def _handle_monitoring(self, monitoring_data: Dict[str, Any]) -> Union[str, object]:
         """
         Hook: AgentLifecycle.on_step_complete()
         What Happens: Emits node/edge stats and performance timing
         """
+        step_name, execution_time, success, error_type = _extract_monitoring_fields(monitoring_data)
+        
         try:
-            step_name = monitoring_data.get('step_name', 'unknown')
-            execution_time = monitoring_data.get('execution_time', 0.0)
-            success = monitoring_data.get('success', True)
-            metrics = monitoring_data.get('metrics', {})
-            
             # Record operation timing
-            self.semantic_graph.monitoring.record_operation_time(step_name, execution_time * 1000)
+            monitoring = self.semantic_graph.monitoring
+            handle = self._step_handles.get(step_name)
+            if handle is None:
+                handle = self._step_handles[step_name] = monitoring.register_step(step_name)
+            monitoring.record_operation_time_h(handle, execution_time * 1000)
             
             # Record errors if any
             if not success:
-                error_type = monitoring_data.get('error_type', 'general_error')
-                self.semantic_graph.monitoring.record_error(error_type)
-            
-            # Log monitoring event
-            monitoring_log = {
-                'step_name': step_name,
-                'execution_time': execution_time,
-                'success': success,
-                'metrics': metrics,
-                'timestamp': datetime.now().isoformat()
-            }
-            
+                monitoring.record_error(error_type)
+        except Exception:
+            logger.exception("Monitoring integration failed")
+            return _ERR
+        
+        with self._stats_lock:
+            self._stats[StatIdx.MONITORING_EVENTS] += 1
+        
+        if MONITORING_RELEVANCE < self._min_relevance:
+            return f"Monitoring data recorded for step: {step_name} (not added to graph)"
+        
+        # The graph only sees the periodic summary of these
+        self._monitor_ring.append((step_name, execution_time, success, None if success else error_type, time.time_ns()))
+        if self._monitor_timer is None:
+            self._schedule_monitoring_summary()
+        
+        return f"Monitoring data recorded for step: {step_name}"
+    
+    def _schedule_monitoring_summary(self):
+        """Arm the timer for the next monitoring summary"""
+        with self._monitor_lock:
+            if self._monitor_timer is not None and self._monitor_timer.is_alive():
+                return
+            self._monitor_timer = threading.Timer(MONITOR_SUMMARY_INTERVAL, self._monitoring_timer_fired)
+            self._monitor_timer.daemon = True
+            self._monitor_timer.start()
+    
+    def _monitoring_timer_fired(self):
+        """Write the summary and re-arm while steps keep arriving"""
+        with self._monitor_lock:
+            self._monitor_timer = None
+        if self.flush_monitoring_summary():
+            self._schedule_monitoring_summary()
+    
+    def flush_monitoring_summary(self) -> bool:
+        """Aggregate buffered step telemetry into one monitoring context event"""
+        entries = []
+        ring = self._monitor_ring
+        while ring:
+            entries.append(ring.popleft())
+        if not entries:
+            return False
+        
+        step_times = defaultdict(list)
+        error_counts = defaultdict(int)
+        for step_name, execution_time, success, error_type, _ in entries:
+            step_times[step_name].append(execution_time)
+            if not success:
+                error_counts[error_type] += 1
+        
+        p95 = float(np.percentile(np.fromiter((entry[1] for entry in entries), dtype=float, count=len(entries)), 95))
+        step_summary = ", ".join(
+            f"{name} x{len(times)} avg {sum(times) / len(times):.2f}s"
+            for name, times in step_times.items()
+        )
+        content = f"Steps: {len(entries)} ({step_summary}); p95: {p95:.2f}s"
+        if error_counts:
+            content += "; errors: " + ", ".join(f"{name} x{count}" for name, count in error_counts.items())
+        
+        try:
             self.semantic_graph.record_context_event(
                 context_type='monitoring',
-                content=f"Step: {step_name}, Time: {execution_time:.2f}s",
-                relevance=0.3
+                content=content,
+                relevance=MONITORING_RELEVANCE
             )
-            
-            self.integration_stats['monitoring_events'] += 1
-            
-            return f"Monitoring data recorded for step: {step_name}"
-            
-        except Exception as e:
-            logger.error(f"Monitoring integration failed: {e}")
-            return f"Monitoring integration error: {str(e)}"
+        except Exception:
+            logger.exception("Monitoring summary failed")
+        return True
     
     # Utility methods for research agent components
     
@@ -349,19 +737,51 @@ class AIResearchAgentIntegration:
         """Integrate with memory manager to capture writes"""
         original_save_method = memory_manager.save_research_finding
         
-        def enhanced_save_finding(content: str, importance: float = 0.5, **kwargs):
+        # Episode of this memory manager's current research session, set by the
+        # wrapped start/end session calls. One variable per manager, so managers
+        # sharing a context don't see each other's episodes. None means not
+        # known in this context and falls back to reading the memory manager.
+        current_episode = contextvars.ContextVar(f'sg_episode_id_{id(memory_manager):x}', default=None)
+        
+        # Track episode boundaries so saves don't have to look the episode up
+        original_start_session = getattr(memory_manager, 'start_research_session', None)
+        if original_start_session is not None:
+            def tracked_start_session(question: str, *, _set_episode=current_episode.set):
+                episode_id = original_start_session(question)
+                _set_episode(episode_id)
+                return episode_id
+            
+            memory_manager.start_research_session = tracked_start_session
+        
+        original_end_session = getattr(memory_manager, 'end_research_session', None)
+        if original_end_session is not None:
+            def tracked_end_session(final_answer: str = "", *, _set_episode=current_episode.set):
+                try:
+                    return original_end_session(final_answer)
+                finally:
+                    _set_episode(getattr(memory_manager, 'current_episode_id', None))
+            
+            memory_manager.end_research_session = tracked_end_session
+        
+        # Keyword-only defaults bind the hook and helpers as fast locals
+        def enhanced_save_finding(content: str, importance: float = 0.5, *,
+                                  _submit=self._submit_background, _handle=self._handle_memory_output,
+                                  _get_episode=current_episode.get, _getattr=getattr, **kwargs):
             # Call original method
             result = original_save_method(content, importance, **kwargs)
             
             # Integrate with semantic graph
+            episode_id = _get_episode()
+            if episode_id is None:
+                episode_id = _getattr(memory_manager, 'current_episode_id', 'default')
             memory_data = {
                 'content': content,
                 'importance': importance,
                 'memory_type': 'research_finding',
-                'session_id': getattr(memory_manager, 'current_episode_id', 'default'),
+                'session_id': episode_id,
                 **kwargs
             }
-            self._handle_memory_output(memory_data)
+            _submit(_handle, memory_data)
             
             return result
         
@@ -373,8 +793,10 @@ class AIResearchAgentIntegration:
         """Integrate with tool executor to capture usage"""
         original_invoke_method = tool_executor.invoke
         
-        def enhanced_invoke(tool_input: Dict[str, Any]):
-            start_time = datetime.now()
+        def enhanced_invoke(tool_input: Dict[str, Any], *,
+                            _submit=self._submit_background, _handle=self._handle_tool_usage,
+                            _now=time.monotonic_ns, _str=str):
+            start_ns = _now()
             
             try:
                 # Call original method
@@ -382,23 +804,22 @@ class AIResearchAgentIntegration:
                 success = True
                 error = None
             except Exception as e:
-                result = f"Tool execution failed: {str(e)}"
+                result = f"Tool execution failed: {_str(e)}"
                 success = False
-                error = str(e)
+                error = _str(e)
             
-            end_time = datetime.now()
-            execution_time = (end_time - start_time).total_seconds()
+            execution_time = (_now() - start_ns) / 1e9
             
             # Integrate with semantic graph
             tool_data = {
                 'tool_name': tool_input.get('tool', 'unknown'),
-                'tool_input': str(tool_input.get('tool_input', '')),
-                'tool_output': str(result),
+                'tool_input': tool_input.get('tool_input', ''),
+                'tool_output': result,
                 'execution_time': execution_time,
                 'success': success,
                 'error': error
             }
-            self._handle_tool_usage(tool_data)
+            _submit(_handle, tool_data)
             
             if not success:
                 raise Exception(error)
@@ -413,7 +834,7 @@ class AIResearchAgentIntegration:
         """Integrate with research loop to capture findings"""
         original_execute_step = research_agent.execute_research_step
         
-        def enhanced_execute_step(state):
+        def enhanced_execute_step(state, *, _submit=self._submit_background, _handle=self._handle_finding):
             # Call original method
             result_state = original_execute_step(state)
             
@@ -430,7 +851,7 @@ class AIResearchAgentIntegration:
                     'sources': latest_finding.get('external_research', []),
                     'analysis': latest_finding.get('analysis', '')
                 }
-                self._handle_finding(finding_data)
+                _submit(_handle, finding_data)
             
             return result_state
         
@@ -443,47 +864,85 @@ class AIResearchAgentIntegration:
         if hasattr(rlhf_system, 'feedback_collector') and rlhf_system.feedback_collector:
             original_capture_method = rlhf_system.feedback_collector.capture_research_output
             
-            def enhanced_capture_output(research_result, research_question, session_id):
+            def enhanced_capture_output(research_result, research_question, session_id, *,
+                                        _record=self.semantic_graph.record_context_event,
+                                        _skip=RLHF_CAPTURE_RELEVANCE < self._min_relevance):
                 # Call original method
                 result = original_capture_method(research_result, research_question, session_id)
                 
                 # Integrate with semantic graph (this would be triggered by user feedback)
                 # For now, we just log the capture event
-                self.semantic_graph.record_context_event(
-                    context_type='rlhf_capture',
-                    content=f"Research output captured for feedback: {session_id}",
-                    relevance=0.5
-                )
+                if not _skip:
+                    _record(
+                        context_type='rlhf_capture',
+                        content=f"Research output captured for feedback: {session_id}",
+                        relevance=RLHF_CAPTURE_RELEVANCE
+                    )
                 
                 return result
             
             rlhf_system.feedback_collector.capture_research_output = enhanced_capture_output
             logger.info("RLHF system integrated with semantic graph")
     
+    @property
+    def integration_stats(self) -> Dict[str, int]:
+        """Snapshot of the integration counters keyed by name"""
+        return dict(zip(_STAT_NAMES, self._stats))
+    
+    def _total_events(self) -> int:
+        """Total hook events handled so far"""
+        return sum(self._stats[:_EVENT_STAT_COUNT])
+    
     def get_integration_statistics(self) -> Dict[str, Any]:
         """Get comprehensive integration statistics"""
         semantic_stats = self.semantic_graph.get_comprehensive_stats()
+        stats = self.integration_stats
+        lookups = stats['retrieval_cache_hits'] + stats['retrieval_cache_misses']
+        flushes = stats['events_per_flush_count']
         
         return {
-            'integration_stats': self.integration_stats,
+            'integration_stats': stats,
+            'cache_hit_rate': stats['retrieval_cache_hits'] / lookups if lookups else 0.0,
+            'mean_batch_size': stats['events_per_flush_sum'] / flushes if flushes else 0.0,
             'semantic_graph_stats': semantic_stats,
             'hooks_registered': len(self.integration_hooks),
-            'total_integrations': sum(self.integration_stats.values()),
-            'last_updated': datetime.now().isoformat()
+            'total_integrations': self._total_events(),
+            'last_updated': _iso_now_cached()
         }
     
-    def process_pending_events(self):
-        """Process any pending ingestion events"""
-        self.semantic_graph.process_pending_ingestion()
+    def process_pending_events(self, chunk_size: int = PENDING_CHUNK_SIZE,
+                               max_chunks: Optional[int] = None) -> int:
+        """Process pending ingestion events in bounded chunks, returning the number processed"""
+        # Hooks still running on the pool haven't queued their events yet
+        self.wait_for_hooks()
+        self.flush_events()
+        
+        # Drain chunk by chunk, yielding the GIL in between so hook callers on
+        # other threads aren't stalled behind one long pass over the backlog
+        processed = 0
+        chunks = 0
+        while max_chunks is None or chunks < max_chunks:
+            count = self.semantic_graph.process_pending_ingestion(limit=chunk_size)
+            if not count:
+                break
+            processed += count
+            chunks += 1
+            time.sleep(0)
+        
+        return processed
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics for the semantic graph query caches"""
+        return self.semantic_graph.get_query_cache_stats()
     
     def get_integration_health(self) -> Dict[str, Any]:
         """Get health status of integration points"""
         health_data = {
             'integration_points_active': len(self.integration_hooks),
-            'total_events_processed': sum(self.integration_stats.values()),
+            'total_events_processed': self._total_events(),
             'semantic_graph_health': self.semantic_graph.get_monitoring_dashboard_data(),
             'integration_errors': 0,  # Could track errors per integration point
-            'last_activity': datetime.now().isoformat()
+            'last_activity': _iso_now_cached()
         }
         
         # Determine overall health
@@ -499,6 +958,44 @@ def create_ai_research_agent_integration(semantic_graph_agent: SemanticGraphAgen
     """Factory function to create AI research agent integration"""
     return AIResearchAgentIntegration(semantic_graph_agent)
 
+@lru_cache(maxsize=8)
+def _cached_sg(use_neo4j: bool, cfg_key: tuple) -> SemanticGraphAgent:
+    """Semantic graph agent for a backend configuration, created once"""
+    return create_semantic_graph_agent(use_neo4j, dict(cfg_key) if cfg_key else None)
+
+def _shared_semantic_graph_agent(use_neo4j: bool, neo4j_config: Optional[Dict[str, Any]]) -> SemanticGraphAgent:
+    """
+    Get the semantic graph agent shared by integrations with the same backend config.
+    The returned agent (graph, caches, Neo4j driver) is shared, so changes to it
+    are seen by every research agent integrated with that config.
+    """
+    cfg_key = tuple(sorted(neo4j_config.items())) if neo4j_config else ()
+    try:
+        return _cached_sg(use_neo4j, cfg_key)
+    except TypeError:
+        # Config with unhashable values, don't share
+        return create_semantic_graph_agent(use_neo4j, neo4j_config)
+
+def _find_memory_manager(research_agent):
+    """Memory manager behind the agent's memory tools (owner of the first bound tool function)"""
+    return next(
+        (tool.func.__self__ for tool in research_agent.advanced_memory_tools
+         if getattr(getattr(tool, 'func', None), '__self__', None) is not None),
+        None
+    )
+
+def _find_rlhf_system(research_agent):
+    """The agent itself when RLHF is enabled on it"""
+    return research_agent if getattr(research_agent, 'rlhf_enabled', False) else None
+
+# (component, finder returning the target or None, integration method)
+_INTEGRATIONS = (
+    ('memory manager', _find_memory_manager, AIResearchAgentIntegration.integrate_memory_manager),
+    ('tool executor', operator.attrgetter('tool_executor'), AIResearchAgentIntegration.integrate_tool_executor),
+    ('research loop', lambda research_agent: research_agent, AIResearchAgentIntegration.integrate_research_loop),
+    ('RLHF system', _find_rlhf_system, AIResearchAgentIntegration.integrate_rlhf_system)
+)
+
 # Integration helper for research agent
 def integrate_research_agent_with_semantic_graph(research_agent, use_neo4j: bool = False, 
                                                 neo4j_config: Optional[Dict[str, Any]] = None):
@@ -512,31 +1009,45 @@ def integrate_research_agent_with_semantic_graph(research_agent, use_neo4j: bool
     
     Returns:
         AIResearchAgentIntegration: The integration instance
+    
+    Integrating the same agent twice returns the existing integration instead
+    of wrapping its hooks again.
     """
-    # Create semantic graph agent
-    from .research_agent_integration import create_semantic_graph_agent
-    semantic_graph_agent = create_semantic_graph_agent(use_neo4j, neo4j_config)
+    existing = getattr(research_agent, '_semantic_graph_integration', None)
+    if existing is not None:
+        logger.info("Research agent already integrated with semantic graph, reusing integration")
+        return existing
+    
+    # Semantic graph agent shared by all research agents with this backend
+    semantic_graph_agent = _shared_semantic_graph_agent(use_neo4j, neo4j_config)
     
     # Create integration
     integration = create_ai_research_agent_integration(semantic_graph_agent)
     
-    # Integrate all components
-    if hasattr(research_agent, 'advanced_memory_tools'):
-        # Find memory manager in tools
-        for tool in research_agent.advanced_memory_tools:
-            if hasattr(tool, 'func') and hasattr(tool.func, '__self__'):
-                memory_manager = tool.func.__self__
-                integration.integrate_memory_manager(memory_manager)
-                break
-    
-    if hasattr(research_agent, 'tool_executor'):
-        integration.integrate_tool_executor(research_agent.tool_executor)
-    
-    integration.integrate_research_loop(research_agent)
+    # Integrate all components the agent has
+    for component, find_target, integrate in _INTEGRATIONS:
+        try:
+            target = find_target(research_agent)
+        except AttributeError:
+            target = None
+        if target is None:
+            logger.debug(f"Research agent has no {component}, skipping integration")
+            continue
+        integrate(integration, target)
     
-    if hasattr(research_agent, 'rlhf_enabled') and research_agent.rlhf_enabled:
-        integration.integrate_rlhf_system(research_agent)
+    _tag_integration(research_agent, integration)
     
     logger.info("Complete research agent integration with semantic graph completed")
     
-    return integration
\ No newline at end of file
+    return integration
+
+def _tag_integration(research_agent, integration: AIResearchAgentIntegration):
+    """Remember the integration on the agent so repeat calls can reuse it"""
+    try:
+        research_agent._semantic_graph_integration = integration
+    except (AttributeError, TypeError, ValueError):
+        # Compiled graphs may be pydantic models that reject unknown fields
+        try:
+            object.__setattr__(research_agent, '_semantic_graph_integration', integration)
+        except (AttributeError, TypeError):
+            logger.warning("Could not tag research agent with its semantic graph integration")
\ No newline at end of file
@@ -13,8 +13,25 @@ from datetime import datetime
 import logging
 import json
 
+# Faster serializer for properties sent to Neo4j, falls back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+def _dumps_properties(properties: Dict[str, Any]) -> str:
+    """Serialize node properties to a JSON string"""
+    if ORJSON_AVAILABLE:
+        # OPT_NON_STR_KEYS: json.dumps accepts int/float/bool/None keys too
+        return orjson.dumps(
+            properties,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(properties)
+
 class NodeType(Enum):
     """Types of nodes in the semantic graph"""
     CONCEPT = "concept"
@@ -415,7 +432,7 @@ class SemanticGraph:
                 f"CREATE (n:{node.type.value} {{id: $id, label: $label, properties: $properties}})",
                 id=node.id,
                 label=node.label,
-                properties=json.dumps(node.properties)
+                properties=_dumps_properties(node.properties)
             )
     
     def _add_edge_to_neo4j(self, edge: GraphEdge):
@@ -4,12 +4,14 @@ Graph Ingestion Engine
 Handles ingestion of data from various sources into the semantic graph
 """
 
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Callable, Iterator, Union
+from dataclasses import dataclass, field
 from enum import Enum
+from abc import ABC, abstractmethod
 import logging
 from datetime import datetime
 import asyncio
+import threading
 from concurrent.futures import ThreadPoolExecutor
 
 from .graph_core import SemanticGraph, GraphNode, GraphEdge, NodeType, EdgeType
@@ -37,6 +39,138 @@ class IngestionEvent:
     priority: int = 1  # 1=low, 2=medium, 3=high
     processed: bool = False
 
+class EventBatch(ABC):
+    """Column-oriented buffer of events from one source, one list per field"""
+    
+    @abstractmethod
+    def append(self, *fields):
+        """Buffer one event, given as its field values"""
+    
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of buffered events"""
+    
+    @abstractmethod
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Yield each buffered event as an ingestion data dict"""
+
+@dataclass
+class MemoryBatch(EventBatch):
+    """Buffered memory manager writes"""
+    contents: List[str] = field(default_factory=list)
+    importances: List[float] = field(default_factory=list)
+    memory_types: List[str] = field(default_factory=list)
+    session_ids: List[str] = field(default_factory=list)
+    timestamps_ns: List[int] = field(default_factory=list)
+    concepts: List[Optional[List[str]]] = field(default_factory=list)
+    citations: List[Optional[List[str]]] = field(default_factory=list)
+    
+    def append(self, content, importance, memory_type, session_id, timestamp_ns, concepts=None, citations=None):
+        self.contents.append(content)
+        self.importances.append(importance)
+        self.memory_types.append(memory_type)
+        self.session_ids.append(session_id)
+        self.timestamps_ns.append(timestamp_ns)
+        self.concepts.append(concepts)
+        self.citations.append(citations)
+    
+    def __len__(self) -> int:
+        return len(self.contents)
+    
+    def records(self) -> Iterator[Dict[str, Any]]:
+        for content, importance, memory_type, session_id, timestamp_ns, concepts, citations in zip(
+            self.contents, self.importances, self.memory_types, self.session_ids,
+            self.timestamps_ns, self.concepts, self.citations
+        ):
+            data = {
+                'content': content,
+                'importance': importance,
+                'memory_type': memory_type,
+                'session_id': session_id,
+                'timestamp_ns': timestamp_ns,
+                'source': 'memory_manager'
+            }
+            if concepts is not None:
+                data['concepts'] = concepts
+            if citations is not None:
+                data['citations'] = citations
+            yield data
+
+@dataclass
+class ToolUsageBatch(EventBatch):
+    """Buffered tool executor calls"""
+    tool_names: List[str] = field(default_factory=list)
+    inputs: List[Any] = field(default_factory=list)
+    outputs: List[Any] = field(default_factory=list)
+    execution_times: List[float] = field(default_factory=list)
+    successes: List[bool] = field(default_factory=list)
+    timestamps_ns: List[int] = field(default_factory=list)
+    usage_contexts: List[str] = field(default_factory=list)
+    
+    def append(self, tool_name, tool_input, tool_output, execution_time, success, timestamp_ns, usage_context):
+        self.tool_names.append(tool_name)
+        self.inputs.append(tool_input)
+        self.outputs.append(tool_output)
+        self.execution_times.append(execution_time)
+        self.successes.append(success)
+        self.timestamps_ns.append(timestamp_ns)
+        self.usage_contexts.append(usage_context)
+    
+    def __len__(self) -> int:
+        return len(self.tool_names)
+    
+    def records(self) -> Iterator[Dict[str, Any]]:
+        for tool_name, tool_input, tool_output, execution_time, success, timestamp_ns, usage_context in zip(
+            self.tool_names, self.inputs, self.outputs, self.execution_times,
+            self.successes, self.timestamps_ns, self.usage_contexts
+        ):
+            yield {
+                'tool_name': tool_name,
+                'input': tool_input,
+                'output': tool_output,
+                'execution_time': execution_time,
+                'success': success,
+                'timestamp_ns': timestamp_ns,
+                'usage_context': usage_context
+            }
+
+@dataclass
+class FindingBatch(EventBatch):
+    """Buffered research findings"""
+    findings: List[str] = field(default_factory=list)
+    analyses: List[str] = field(default_factory=list)
+    confidences: List[float] = field(default_factory=list)
+    sources: List[List[Any]] = field(default_factory=list)
+    step_infos: List[Dict[str, Any]] = field(default_factory=list)
+    timestamps_ns: List[int] = field(default_factory=list)
+    
+    def append(self, finding, analysis, confidence, sources, step_info, timestamp_ns):
+        self.findings.append(finding)
+        self.analyses.append(analysis)
+        self.confidences.append(confidence)
+        self.sources.append(sources)
+        self.step_infos.append(step_info)
+        self.timestamps_ns.append(timestamp_ns)
+    
+    def __len__(self) -> int:
+        return len(self.findings)
+    
+    def records(self) -> Iterator[Dict[str, Any]]:
+        for finding, analysis, confidence, sources, step_info, timestamp_ns in zip(
+            self.findings, self.analyses, self.confidences, self.sources,
+            self.step_infos, self.timestamps_ns
+        ):
+            yield {
+                'finding': finding,
+                'analysis': analysis,
+                'confidence': confidence,
+                'sources': sources,
+                'step_info': step_info,
+                # Must not raise: one bad row would fail the whole batch
+                'research_step': step_info.get('step_number', 0) if isinstance(step_info, dict) else 0,
+                'timestamp_ns': timestamp_ns
+            }
+
 class GraphIngestionEngine:
     """Main engine for ingesting data into the semantic graph"""
     
@@ -47,6 +181,7 @@ class GraphIngestionEngine:
         
         # Ingestion queue and processing
         self.ingestion_queue: List[IngestionEvent] = []
+        self._queue_lock = threading.Lock()  # queue is drained from a background thread
         self.processing_hooks: Dict[IngestionSource, List[Callable]] = {}
         self.batch_size = 10
         self.max_workers = 4
@@ -92,26 +227,57 @@ class GraphIngestionEngine:
             priority=priority
         )
         
-        self.ingestion_queue.append(event)
+        with self._queue_lock:
+            self.ingestion_queue.append(event)
         logger.debug(f"Added ingestion event from {source.value}")
         
         # Process immediately if high priority
         if priority >= 3:
             self.process_queue()
     
-    def process_queue(self, batch_size: Optional[int] = None):
-        """Process events in the ingestion queue"""
-        if not self.ingestion_queue:
+    def ingest_events_batch(self, source: IngestionSource, data_list: Union[List[Dict[str, Any]], EventBatch],
+                            priority: int = 1):
+        """Add several ingestion events from one source to the queue at once"""
+        if not len(data_list):
             return
         
-        batch_size = batch_size or self.batch_size
+        records = data_list.records() if isinstance(data_list, EventBatch) else data_list
+        # Keep each event's capture time so queue ordering reflects when it
+        # happened, not when its batch was flushed
+        now = datetime.now()
+        events = [
+            IngestionEvent(
+                source=source,
+                data=data,
+                timestamp=(datetime.fromtimestamp(data['timestamp_ns'] / 1e9)
+                           if data.get('timestamp_ns') is not None else now),
+                priority=priority
+            )
+            for data in records
+        ]
         
-        # Sort by priority and timestamp
-        self.ingestion_queue.sort(key=lambda x: (-x.priority, x.timestamp))
+        with self._queue_lock:
+            self.ingestion_queue.extend(events)
+        logger.debug(f"Added {len(events)} ingestion events from {source.value}")
         
-        # Process batch
-        batch = self.ingestion_queue[:batch_size]
-        self.ingestion_queue = self.ingestion_queue[batch_size:]
+        # Process immediately if high priority
+        if priority >= 3:
+            self.process_queue()
+    
+    def process_queue(self, batch_size: Optional[int] = None) -> int:
+        """Process events in the ingestion queue, returning how many were taken off it"""
+        batch_size = batch_size or self.batch_size
+        
+        with self._queue_lock:
+            if not self.ingestion_queue:
+                return 0
+            
+            # Sort by priority and timestamp
+            self.ingestion_queue.sort(key=lambda x: (-x.priority, x.timestamp))
+            
+            # Process batch
+            batch = self.ingestion_queue[:batch_size]
+            self.ingestion_queue = self.ingestion_queue[batch_size:]
         
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             futures = [executor.submit(self._process_event, event) for event in batch]
@@ -125,6 +291,7 @@ class GraphIngestionEngine:
         
         self.ingestion_stats['last_processed'] = datetime.now()
         logger.info(f"Processed {len(batch)} ingestion events")
+        return len(batch)
     
     def _process_event(self, event: IngestionEvent):
         """Process a single ingestion event"""
@@ -516,6 +683,7 @@ class GraphIngestionEngine:
     
     def clear_queue(self):
         """Clear the ingestion queue"""
-        cleared_count = len(self.ingestion_queue)
-        self.ingestion_queue.clear()
+        with self._queue_lock:
+            cleared_count = len(self.ingestion_queue)
+            self.ingestion_queue.clear()
         logger.info(f"Cleared {cleared_count} events from ingestion queue")
\ No newline at end of file
@@ -8,6 +8,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
+import threading
 from collections import defaultdict, Counter
 import json
 
@@ -32,6 +33,7 @@ class GraphMonitoring:
         self.graph = semantic_graph
         self.stats_history = []
         self.max_history_size = 100
+        self._history_lock = threading.Lock()  # stats can be collected from several threads
         
         # Monitoring configuration
         self.monitoring_enabled = True
@@ -46,6 +48,11 @@ class GraphMonitoring:
         self.operation_times = defaultdict(list)
         self.error_counts = defaultdict(int)
         
+        # Registered operations: handle -> the same list as operation_times[name]
+        self._step_times: List[List[float]] = []
+        self._step_handles: Dict[str, int] = {}
+        self._step_lock = threading.Lock()  # steps can be registered from several threads
+        
         logger.info("Graph monitoring system initialized")
     
     def collect_comprehensive_stats(self) -> GraphStats:
@@ -77,9 +84,10 @@ class GraphMonitoring:
         )
         
         # Store in history
-        self.stats_history.append(stats)
-        if len(self.stats_history) > self.max_history_size:
-            self.stats_history.pop(0)
+        with self._history_lock:
+            self.stats_history.append(stats)
+            if len(self.stats_history) > self.max_history_size:
+                self.stats_history.pop(0)
         
         return stats
     
@@ -331,8 +339,10 @@ class GraphMonitoring:
     def get_trend_analysis(self, hours: int = 24) -> Dict[str, Any]:
         """Analyze trends over the specified time period"""
         cutoff_time = datetime.now() - timedelta(hours=hours)
+        with self._history_lock:
+            history = list(self.stats_history)
         recent_stats = [
-            stats for stats in self.stats_history 
+            stats for stats in history 
             if stats.timestamp >= cutoff_time
         ]
         
@@ -425,6 +435,25 @@ class GraphMonitoring:
         if len(self.operation_times[operation]) > 100:
             self.operation_times[operation].pop(0)
     
+    def register_step(self, step_name: str) -> int:
+        """Get an integer handle for recording times of an operation"""
+        with self._step_lock:
+            handle = self._step_handles.get(step_name)
+            if handle is None:
+                handle = len(self._step_times)
+                self._step_times.append(self.operation_times[step_name])
+                self._step_handles[step_name] = handle
+        return handle
+    
+    def record_operation_time_h(self, handle: int, time_ms: float):
+        """Record the time taken for an operation registered with register_step"""
+        times = self._step_times[handle]
+        times.append(time_ms)
+        
+        # Keep only recent times (last 100 per operation)
+        if len(times) > 100:
+            times.pop(0)
+    
     def record_error(self, error_type: str):
         """Record an error occurrence"""
         self.error_counts[error_type] += 1
@@ -464,7 +493,9 @@ class GraphMonitoring:
         if format.lower() == 'json':
             # Convert stats to JSON-serializable format
             serializable_history = []
-            for stats in self.stats_history:
+            with self._history_lock:
+                history = list(self.stats_history)
+            for stats in history:
                 serializable_stats = {
                     'timestamp': stats.timestamp.isoformat(),
                     'node_stats': stats.node_stats,
@@ -481,9 +512,15 @@ class GraphMonitoring:
     
     def clear_history(self):
         """Clear statistics history"""
-        cleared_count = len(self.stats_history)
-        self.stats_history.clear()
-        self.operation_times.clear()
+        with self._history_lock:
+            cleared_count = len(self.stats_history)
+            self.stats_history.clear()
+        with self._step_lock:
+            self.operation_times.clear()
+            # Keep registered handles pointing at the lists in operation_times
+            for step_name, handle in self._step_handles.items():
+                self._step_times[handle].clear()
+                self.operation_times[step_name] = self._step_times[handle]
         self.error_counts.clear()
         
         logger.info(f"Cleared monitoring history ({cleared_count} entries)")
@@ -4,9 +4,11 @@ Semantic Graph Integration with AI Research Agent
 Connects the semantic graph to all components of the research agent
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import copy
 import logging
 from datetime import datetime
+from functools import lru_cache
 
 from .graph_core import SemanticGraph, GraphNode, GraphEdge, NodeType, EdgeType
 from .graph_ingestion import GraphIngestionEngine, IngestionSource
@@ -17,6 +19,9 @@ from .graph_monitoring import GraphMonitoring
 
 logger = logging.getLogger(__name__)
 
+# Max entries in each of the retrieval/planning result caches
+QUERY_CACHE_SIZE = 512
+
 class SemanticGraphAgent:
     """Main integration class for semantic graph with research agent"""
     
@@ -35,6 +40,14 @@ class SemanticGraphAgent:
         self.is_initialized = False
         self.sync_hooks_enabled = True
         
+        # Per-instance query caches, cleared whenever graph mutations are committed.
+        # Results are shared by every hit, so callers only ever get deep copies.
+        self._cached_retrieval = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._retrieve)
+        self._cached_planning = lru_cache(maxsize=QUERY_CACHE_SIZE)(self._plan)
+        # Bumped whenever the caches are cleared, so caches kept by callers
+        # (e.g. the integration's retrieval hook) can tell their entries are stale
+        self.cache_generation = 0
+        
         logger.info("Semantic graph agent initialized")
     
     def initialize_with_training_data(self, training_contexts: List[str]):
@@ -55,6 +68,7 @@ class SemanticGraphAgent:
         
         # Process ingestion queue
         self.ingestion_engine.process_queue()
+        self.clear_query_caches()
         
         self.is_initialized = True
         logger.info("Semantic graph initialization completed")
@@ -88,6 +102,29 @@ class SemanticGraphAgent:
                           strategy: str = "hybrid", top_k: int = 10,
                           node_types: Optional[List[str]] = None) -> Dict[str, Any]:
         """Enhanced retrieval using graph-aware methods"""
+        # Embeddings aren't hashable, so only text queries go through the cache.
+        # Retrieval matches case-insensitively, so the key is normalized.
+        if query_embedding is None:
+            results = self._cached_retrieval(
+                query.strip().lower(), strategy, top_k,
+                tuple(node_types) if node_types else None
+            )
+            results = copy.deepcopy(results)
+            results['query'] = query
+            return results
+        
+        return self.enhanced_retrieval_precomputed(query, query_embedding, strategy, top_k, node_types)
+    
+    def enhanced_retrieval_precomputed(self, query: str, query_embedding: Any,
+                                       strategy: str = "hybrid", top_k: int = 10,
+                                       node_types: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Enhanced retrieval for a query whose embedding is already known (bypasses the text cache)"""
+        # The query text is still needed: hybrid/graph strategies match on labels
+        return self._retrieve(query, query_embedding, strategy, top_k, node_types)
+    
+    def _retrieve(self, query: str, query_embedding: Optional[Any], strategy: str,
+                  top_k: int, node_types: Optional[Tuple[str, ...]]) -> Dict[str, Any]:
+        """Run graph-aware retrieval and format the results"""
         
         # Convert string strategy to enum
         strategy_enum = RetrievalStrategy.HYBRID
@@ -135,6 +172,16 @@ class SemanticGraphAgent:
     def enhanced_planning(self, research_question: str, context: Dict[str, Any] = None,
                          strategy: str = "hybrid", max_steps: int = 8) -> Dict[str, Any]:
         """Enhanced planning using graph-aware methods"""
+        # Context dicts aren't hashable, so only context-free plans are cached.
+        # The question is only trimmed since it appears in the generated steps.
+        if not context:
+            return copy.deepcopy(self._cached_planning(research_question.strip(), strategy, max_steps))
+        
+        return self._plan(research_question, strategy, max_steps, context)
+    
+    def _plan(self, research_question: str, strategy: str, max_steps: int,
+              context: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Generate and order a graph-aware plan"""
         
         # Convert string strategy to enum
         strategy_enum = PlanningStrategy.HYBRID
@@ -152,15 +199,38 @@ class SemanticGraphAgent:
         
         return plan
     
+    def clear_query_caches(self):
+        """Drop cached retrieval/planning results after the graph changes"""
+        self.cache_generation += 1
+        # The retrieval system keeps its own result cache underneath ours
+        self.retrieval_system.clear_cache()
+        self._cached_retrieval.cache_clear()
+        self._cached_planning.cache_clear()
+    
+    def get_query_cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics for the retrieval and planning caches"""
+        stats = {}
+        for name, cached in (('retrieval', self._cached_retrieval), ('planning', self._cached_planning)):
+            info = cached.cache_info()
+            stats[name] = {
+                'hits': info.hits,
+                'misses': info.misses,
+                'size': info.currsize,
+                'max_size': info.maxsize
+            }
+        return stats
+    
     # RLHF integration methods
     def record_user_feedback(self, user_id: str, preferred_content: str, 
                            rejected_content: str = "", feedback_type: str = "quality",
                            confidence: float = 1.0, context: str = "") -> str:
         """Record user feedback in the graph"""
-        return self.rlhf_integration.record_feedback(
+        preference_id = self.rlhf_integration.record_feedback(
             user_id, preferred_content, rejected_content, 
             feedback_type, confidence, context
         )
+        self.clear_query_caches()
+        return preference_id
     
     def get_generation_guidance(self, user_id: str, content_type: str = "general") -> Dict[str, Any]:
         """Get generation guidance based on user preferences"""
@@ -262,9 +332,13 @@ class SemanticGraphAgent:
         """Get data for monitoring dashboard"""
         return self.monitoring.get_monitoring_dashboard_data()
     
-    def process_pending_ingestion(self):
-        """Process any pending ingestion events"""
-        self.ingestion_engine.process_queue()
+    def process_pending_ingestion(self, limit: Optional[int] = None) -> int:
+        """Process one batch of pending ingestion events (at most limit if given), returning the count"""
+        processed = self.ingestion_engine.process_queue(batch_size=limit)
+        if processed:
+            # Only new graph content can make cached query results stale
+            self.clear_query_caches()
+        return processed
     
     def cleanup(self):
         """Cleanup resources"""
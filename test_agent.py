@@ -4,8 +4,11 @@ Test script for the AI Research Agent
 Verifies core functionality before full deployment
 """
 
+import contextlib
 import os
 import sys
+import threading
+import time
 from agent.research_agent import create_agent
 from memory.langmem_tools import get_memory_tools
 from llm.groq_wrapper import load_groq_llm
@@ -851,6 +854,189 @@ def test_contextual_engineering():
         traceback.print_exc()
         return False
 
+# Semantic graph integration behavior: hook batching, background dispatch and
+# caching, run against an in-memory stand-in for SemanticGraphAgent
+
+class _RecordingIngestionEngine:
+    """Records event batches handed over by the integration"""
+    
+    def __init__(self):
+        self.batches = []  # (source, event count) per ingest_events_batch call
+        self.pending = 0
+        self.lock = threading.Lock()
+    
+    def ingest_events_batch(self, source, data_list, priority=1):
+        with self.lock:
+            self.batches.append((source, len(data_list)))
+            self.pending += len(data_list)
+
+class _StubSemanticGraph:
+    """Minimal SemanticGraphAgent stand-in counting the calls it receives"""
+    
+    def __init__(self):
+        self.ingestion_engine = _RecordingIngestionEngine()
+        self.retrieval_calls = 0
+        self.cache_generation = 0
+    
+    def enhanced_retrieval(self, query, query_embedding=None, strategy="hybrid", top_k=10, node_types=None):
+        self.retrieval_calls += 1
+        return {'query': query, 'results': [{'call': self.retrieval_calls}], 'total_results': 1}
+    
+    def process_pending_ingestion(self, limit=None):
+        engine = self.ingestion_engine
+        with engine.lock:
+            count = min(engine.pending, limit or engine.pending)
+            engine.pending -= count
+        if count:
+            self.cache_generation += 1
+        return count
+
+@contextlib.contextmanager
+def _integration_settings(**settings):
+    """Temporarily override module-level batching settings of the integration"""
+    from semantic_graph import ai_research_agent_integration as sg_integration
+    saved = {name: getattr(sg_integration, name) for name in settings}
+    for name, value in settings.items():
+        setattr(sg_integration, name, value)
+    try:
+        yield sg_integration
+    finally:
+        for name, value in saved.items():
+            setattr(sg_integration, name, value)
+
+def _wait_until(condition, timeout=2.0):
+    """Poll condition until it holds or timeout seconds have passed"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+def test_integration_flush_by_size():
+    """Buffered hook events are handed over as one batch once SG_BATCH_SIZE is reached"""
+    with _integration_settings(SG_BATCH_SIZE=4, SG_BATCH_MS=60_000, SG_SYNC_INGEST=False) as sg_integration:
+        graph = _StubSemanticGraph()
+        integration = sg_integration.AIResearchAgentIntegration(graph)
+        try:
+            for i in range(3):
+                integration._handle_memory_output({'content': f"note {i}"})
+            assert graph.ingestion_engine.batches == []
+            
+            integration._handle_memory_output({'content': "note 3"})
+            assert graph.ingestion_engine.batches == [(sg_integration.IngestionSource.MEMORY, 4)]
+            assert integration.integration_stats['batch_flushes_by_size'] == 1
+        finally:
+            integration.shutdown()
+
+def test_integration_flush_by_timer():
+    """A partial batch is handed over SG_BATCH_MS after its first event"""
+    with _integration_settings(SG_BATCH_SIZE=100, SG_BATCH_MS=20, SG_SYNC_INGEST=False) as sg_integration:
+        graph = _StubSemanticGraph()
+        integration = sg_integration.AIResearchAgentIntegration(graph)
+        try:
+            integration._handle_memory_output({'content': "lone note"})
+            assert _wait_until(lambda: graph.ingestion_engine.batches)
+            assert graph.ingestion_engine.batches == [(sg_integration.IngestionSource.MEMORY, 1)]
+            assert integration.integration_stats['batch_flushes_by_time'] == 1
+        finally:
+            integration.shutdown()
+
+def test_integration_drains_dispatched_hooks():
+    """process_pending_events sees every event from hooks still running on the pool"""
+    class EchoToolExecutor:
+        def invoke(self, tool_input):
+            return f"result for {tool_input['tool_input']}"
+    
+    with _integration_settings(SG_BATCH_SIZE=1000, SG_BATCH_MS=60_000, SG_SYNC_INGEST=False) as sg_integration:
+        graph = _StubSemanticGraph()
+        integration = sg_integration.AIResearchAgentIntegration(graph)
+        try:
+            tool_executor = EchoToolExecutor()
+            integration.integrate_tool_executor(tool_executor)
+            for i in range(50):
+                tool_executor.invoke({'tool': 'search', 'tool_input': f"query {i}"})
+            
+            assert integration.process_pending_events() == 50
+            assert integration.integration_stats['tool_usage_logs'] == 50
+            assert sum(count for _, count in graph.ingestion_engine.batches) == 50
+        finally:
+            integration.shutdown()
+
+def test_integration_retrieval_cache_invalidation():
+    """Cached retrievals are copies, and are dropped once new events reach the graph"""
+    with _integration_settings(SG_SYNC_INGEST=False) as sg_integration:
+        graph = _StubSemanticGraph()
+        integration = sg_integration.AIResearchAgentIntegration(graph)
+        # A second integration sharing the graph must notice the change too
+        other = sg_integration.AIResearchAgentIntegration(graph)
+        try:
+            other._handle_retrieval({'query': "shared query"})
+            other._handle_retrieval({'query': "shared query"})
+            assert graph.retrieval_calls == 1
+            graph.retrieval_calls = 0
+            
+            first = integration._handle_retrieval({'query': "Graph Neural Networks"})
+            first['results'].clear()
+            second = integration._handle_retrieval({'query': "graph neural networks "})
+            assert graph.retrieval_calls == 1
+            assert second['results'] == [{'call': 1}]
+            
+            integration._handle_memory_output({'content': "new finding"})
+            assert integration.process_pending_events() > 0
+            third = integration._handle_retrieval({'query': "graph neural networks"})
+            assert graph.retrieval_calls == 2
+            assert third['results'] == [{'call': 2}]
+            
+            other._handle_retrieval({'query': "shared query"})
+            assert graph.retrieval_calls == 3
+        finally:
+            integration.shutdown()
+            other.shutdown()
+
+def test_initial_state_fresh_containers():
+    """Every initial state gets its own containers, never the template's"""
+    from agent.state import STATE_TEMPLATE, create_initial_state, create_minimal_state
+    
+    first = create_initial_state("question one")
+    second = create_initial_state("question two")
+    assert set(first) == set(STATE_TEMPLATE)
+    assert first['research_question'] == "question one"
+    assert first['session_id'] != second['session_id']
+    
+    first['findings'].append({'step': 0})
+    first['rlhf_feedback']['rating'] = 5
+    assert second['findings'] == [] and second['rlhf_feedback'] == {}
+    assert STATE_TEMPLATE['findings'] == [] and STATE_TEMPLATE['rlhf_feedback'] == {}
+    
+    minimal = create_minimal_state("question three")
+    assert minimal['findings'] is not first['findings']
+    assert 'rlhf_feedback' not in minimal
+    assert minimal['session_id'] and minimal['session_id'] != create_minimal_state("question three")['session_id']
+
+def run_semantic_graph_integration_tests():
+    """Run the semantic graph integration behavior tests"""
+    print("\n🕸️ Testing Semantic Graph Integration Behavior")
+    print("=" * 60)
+    
+    tests = (
+        test_integration_flush_by_size,
+        test_integration_flush_by_timer,
+        test_integration_drains_dispatched_hooks,
+        test_integration_retrieval_cache_invalidation,
+        test_initial_state_fresh_containers
+    )
+    all_ok = True
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__doc__}")
+        except Exception as e:
+            print(f"❌ {test.__name__} failed: {type(e).__name__}: {e}")
+            all_ok = False
+    
+    return all_ok
+
 def main():
     """Main test function"""
     print("🚀 AI Research Agent Test Suite - Phase 6 RLHF Integration")
@@ -891,9 +1077,13 @@ def main():
     print("\n" + "=" * 100)
     contextual_engineering_ok = test_contextual_engineering()
     
+    # Test semantic graph integration behavior (batching, dispatch, caching)
+    print("\n" + "=" * 100)
+    semantic_graph_ok = run_semantic_graph_integration_tests()
+    
     # Final results
     print("\n" + "=" * 100)
-    if research_ok and advanced_memory_ok and research_tools_ok and intelligence_layer_ok and user_experience_ok and rlhf_integration_ok and contextual_engineering_ok:
+    if research_ok and advanced_memory_ok and research_tools_ok and intelligence_layer_ok and user_experience_ok and rlhf_integration_ok and contextual_engineering_ok and semantic_graph_ok:
         print("🎉 ALL TESTS PASSED! Phase 7 Contextual Engineering Framework Complete!")
         print("\n🚀 Your AI Research Agent is now the ULTIMATE CONTEXTUAL RESEARCH INTELLIGENCE SYSTEM with:")
         print("   ✅ CORE RESEARCH CAPABILITIES:")
@@ -1007,6 +1197,9 @@ def main():
         print("   • 🧠 Multi-layered intelligence systems")
         print("   • 📊 Comprehensive analytics and optimization")
         print("🚀 The future of AI-powered research is here!")
+    elif research_ok and advanced_memory_ok and research_tools_ok and intelligence_layer_ok and user_experience_ok and rlhf_integration_ok and contextual_engineering_ok:
+        print("⚠️  Core systems work, but semantic graph integration needs attention")
+        print("Check the semantic graph integration behavior tests above")
     elif research_ok and advanced_memory_ok and research_tools_ok and intelligence_layer_ok and user_experience_ok and rlhf_integration_ok:
         print("⚠️  Core systems work, but Contextual Engineering needs attention")
         print("Check the Phase 7 Contextual Engineering implementation")